@@ -349,11 +349,7 @@ class TensorBlock:
         count = c_uintptr_t()
         self._lib.eqs_block_gradients_list(self._ptr, parameters, count)
 
-        result = []
-        for i in range(count.value):
-            result.append(parameters[i].decode("utf8"))
-
-        return result
+        return [p.decode("utf8") for p in parameters[: count.value]]
 
     def has_gradient(self, parameter: str) -> bool:
         """
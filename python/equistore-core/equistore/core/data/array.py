@@ -14,6 +14,10 @@ except ImportError:
     HAS_TORCH = False
 
 
+_c_double_p = ctypes.POINTER(ctypes.c_double)
+_py_object_p = ctypes.POINTER(ctypes.py_object)
+
+
 def _register_origin(name):
     from .._c_lib import _get_library
 
@@ -115,7 +119,7 @@ class ArrayWrapper:
 
 def _object_from_ptr(ptr):
     """Extract the Python object from a pointer to the PyObject"""
-    return ctypes.cast(ptr, ctypes.POINTER(ctypes.py_object)).contents.value
+    return ctypes.cast(ptr, _py_object_p).contents.value
 
 
 @catch_exceptions
@@ -143,7 +147,7 @@ def _eqs_array_data(this, data):
     if not array.dtype == np.float64:
         raise ValueError(f"can not get data pointer for array type {array.dtype}")
 
-    data[0] = array.ctypes.data_as(ctypes.POINTER(ctypes.c_double))
+    data[0] = array.ctypes.data_as(_c_double_p)
 
 
 @catch_exceptions
@@ -158,9 +162,7 @@ def _eqs_array_shape(this, shape_ptr, shape_count):
 def _eqs_array_reshape(this, shape_ptr, shape_count):
     wrapper = _object_from_ptr(this)
 
-    shape = []
-    for i in range(shape_count):
-        shape.append(shape_ptr[i])
+    shape = shape_ptr[:shape_count]
 
     wrapper.array = wrapper.array.reshape(shape)
     wrapper._shape = ctypes.ARRAY(c_uintptr_t, len(shape))(*shape)
@@ -179,9 +181,7 @@ def _eqs_array_swap_axes(this, axis_1, axis_2):
 def _eqs_array_create(this, shape_ptr, shape_count, new_array):
     wrapper = _object_from_ptr(this)
 
-    shape = []
-    for i in range(shape_count):
-        shape.append(shape_ptr[i])
+    shape = shape_ptr[:shape_count]
     dtype = wrapper.array.dtype
 
     if _is_numpy_array(wrapper.array):
@@ -225,11 +225,13 @@ def _eqs_array_move_samples_from(
     output = _object_from_ptr(this).array
     input = _object_from_ptr(input).array
 
-    input_samples = []
-    output_samples = []
-    for i in range(samples_count):
-        input_samples.append(samples_ptr[i].input)
-        output_samples.append(samples_ptr[i].output)
+    if samples_count == 0:
+        return
+
+    # read all the samples mapping at once, instead of one struct at a time
+    samples = np.ctypeslib.as_array(samples_ptr, shape=(samples_count,))
+    input_samples = samples["input"].tolist()
+    output_samples = samples["output"].tolist()
 
     properties = slice(property_start, property_end)
     output[output_samples, ..., properties] = input[input_samples, ..., :]
@@ -140,9 +140,7 @@ class ExternalCpuArray(np.ndarray):
         status = eqs_array.shape(eqs_array.ptr, shape_ptr, shape_count)
         _check_status(status)
 
-        shape = []
-        for i in range(shape_count.value):
-            shape.append(shape_ptr[i])
+        shape = shape_ptr[: shape_count.value]
 
         data = ctypes.POINTER(ctypes.c_double)()
         status = eqs_array.data(eqs_array.ptr, data)
@@ -1,6 +1,10 @@
+import concurrent.futures
 import ctypes
+import functools
+import os
 import pathlib
 import warnings
+import zipfile
 from typing import BinaryIO, Callable, Union
 
 import numpy as np
@@ -21,9 +25,7 @@ def create_numpy_array(shape_ptr, shape_count, array):
     Callback function that can be used with
     :py:func:`equistore.core.io.load_custom_array` to load data in numpy arrays.
     """
-    shape = []
-    for i in range(shape_count):
-        shape.append(shape_ptr[i])
+    shape = shape_ptr[:shape_count]
 
     data = np.empty(shape, dtype=np.float64)
     wrapper = ArrayWrapper(data)
@@ -40,9 +42,7 @@ def create_torch_array(shape_ptr, shape_count, array):
     """
     import torch
 
-    shape = []
-    for i in range(shape_count):
-        shape.append(shape_ptr[i])
+    shape = shape_ptr[:shape_count]
 
     data = torch.empty(shape, dtype=torch.float64, device="cpu")
     wrapper = ArrayWrapper(data)
@@ -83,6 +83,26 @@ CreateArrayCallback = Callable[
 ]
 
 
+# C function pointers for the built-in callbacks, created once and re-used for
+# all loads
+_CREATE_NUMPY_ARRAY_CALLBACK = eqs_create_array_callback_t(create_numpy_array)
+_CREATE_TORCH_ARRAY_CALLBACK = eqs_create_array_callback_t(create_torch_array)
+
+
+def _create_array_callback(create_array: CreateArrayCallback):
+    """
+    Get a C function pointer for ``create_array``. The pointers for the built-in
+    ``create_numpy_array`` and ``create_torch_array`` are created only once, other
+    callbacks are wrapped on every call.
+    """
+    if create_array is create_numpy_array:
+        return _CREATE_NUMPY_ARRAY_CALLBACK
+    elif create_array is create_torch_array:
+        return _CREATE_TORCH_ARRAY_CALLBACK
+    else:
+        return eqs_create_array_callback_t(create_array)
+
+
 def load_custom_array(
     path: Union[str, pathlib.Path],
     create_array: CreateArrayCallback,
@@ -113,7 +133,7 @@ def load_custom_array(
     elif isinstance(path, pathlib.Path):
         path = bytes(path)
 
-    ptr = lib.eqs_tensormap_load(path, eqs_create_array_callback_t(create_array))
+    ptr = lib.eqs_tensormap_load(path, _create_array_callback(create_array))
 
     return TensorMap._from_ptr(ptr)
 
@@ -150,7 +170,7 @@ def load_buffer_custom_array(
     ptr = lib.eqs_tensormap_load_buffer(
         buffer,
         len(buffer),
-        eqs_create_array_callback_t(create_array),
+        _create_array_callback(create_array),
     )
 
     return TensorMap._from_ptr(ptr)
@@ -179,17 +199,25 @@ def save(
     if not isinstance(tensor, TensorMap):
         raise TypeError(f"tensor should be a 'TensorMap', not {type(tensor)}")
 
-    if isinstance(file, (str, pathlib.Path)):
+    add_extension = False
+    if isinstance(file, str):
         if not file.endswith(".npz"):
             file += ".npz"
-            warnings.warn(
-                message=f"adding '.npz' extension, the file will be saved at '{file}'",
-                stacklevel=1,
-            )
+            add_extension = True
+    elif isinstance(file, pathlib.Path):
+        if file.suffix != ".npz":
+            file = file.with_name(file.name + ".npz")
+            add_extension = True
+
+    if add_extension:
+        warnings.warn(
+            message=f"adding '.npz' extension, the file will be saved at '{file}'",
+            stacklevel=1,
+        )
 
     if use_numpy:
         all_entries = _tensor_map_to_dict(tensor)
-        np.savez(file, **all_entries)
+        _write_npz(file, all_entries)
     else:
         lib = _get_library()
         if isinstance(file, str):
@@ -199,25 +227,38 @@ def save(
         else:
             # assume we have a file-like object
             buffer = save_buffer_raw_(tensor)
-            file.write(buffer.raw)
+            file.write(buffer)
 
 
-def save_buffer_raw_(tensor: TensorMap):
-    """Save a TensorMap to an in-memory buffer, returning the data as a ctypes array"""
+_PyByteArray_Resize = ctypes.pythonapi.PyByteArray_Resize
+_PyByteArray_Resize.argtypes = [ctypes.py_object, ctypes.c_ssize_t]
+_PyByteArray_Resize.restype = ctypes.c_int
 
-    lib = _get_library()
+_PyByteArray_AsString = ctypes.pythonapi.PyByteArray_AsString
+_PyByteArray_AsString.argtypes = [ctypes.py_object]
+_PyByteArray_AsString.restype = ctypes.c_void_p
 
-    def realloc(buffer, _ptr, new_size):
-        try:
-            # convert void* to PyObject* and dereference to get a PyObject
-            buffer = ctypes.cast(buffer, ctypes.POINTER(ctypes.py_object))
-            buffer = buffer.contents.value
+_SAVE_BUFFER_INITIAL_SIZE = 64 * 1024
 
-            # resize the buffer to grow it
-            ctypes.resize(buffer, new_size)
-            buffer._length_ = new_size
+_realloc_callback_t = ctypes.CFUNCTYPE(
+    ctypes.c_char_p, ctypes.c_void_p, ctypes.c_char_p, c_uintptr_t
+)
 
-            return ctypes.addressof(buffer)
+
+def save_buffer_raw_(tensor: TensorMap) -> bytearray:
+    """Save a TensorMap to an in-memory buffer, returning the data as a bytearray"""
+
+    lib = _get_library()
+
+    # the data is written directly in the memory of this bytearray, which is grown as
+    # needed by `realloc` below
+    buffer = bytearray(_SAVE_BUFFER_INITIAL_SIZE)
+
+    def realloc(_user_data, _ptr, new_size):
+        try:
+            # resize the buffer in place, this can move the data to a new allocation
+            _PyByteArray_Resize(buffer, new_size)
+            return _PyByteArray_AsString(buffer)
         except Exception as e:
             # we don't want to propagate exceptions through C, so we catch anything
             # here, save the error and return a NULL pointer
@@ -226,33 +267,23 @@ def save_buffer_raw_(tensor: TensorMap):
             _save_exception(error)
             return None
 
-    # start with a buffer of 1024 bytes in a ctypes string buffer (i.e. array of c_char)
-    # we will be able to resize the allocation in `realloc` above, but the type will
-    # stay `array of 1024 c_char elements`.
-    buffer = ctypes.create_string_buffer(1024)
-
     # store the initial pointer and buffer_size on the stack, they will be modified by
     # `eqs_tensormap_save_buffer`
-    buffer_ptr = ctypes.c_char_p(ctypes.addressof(buffer))
-    buffer_size = c_uintptr_t(buffer._length_)
-
-    realloc_type = ctypes.CFUNCTYPE(
-        ctypes.c_char_p, ctypes.c_void_p, ctypes.c_char_p, c_uintptr_t
-    )
+    buffer_ptr = ctypes.c_char_p(_PyByteArray_AsString(buffer))
+    buffer_size = c_uintptr_t(len(buffer))
 
     lib.eqs_tensormap_save_buffer(
         buffer_ptr,
         buffer_size,
-        # convert PyObject to void* to pass it to realloc
-        ctypes.cast(ctypes.pointer(ctypes.py_object(buffer)), ctypes.c_void_p),
-        realloc_type(realloc),
+        # `realloc` already has access to the buffer, no need for user data
+        None,
+        _realloc_callback_t(realloc),
         tensor._ptr,
     )
 
     # remove extra data from the buffer, resizing it to the number of written bytes
     # (stored in buffer_size by `eqs_tensormap_save_buffer`)
-    ctypes.resize(buffer, buffer_size.value)
-    buffer._length_ = buffer_size.value
+    del buffer[buffer_size.value :]
 
     return buffer
 
@@ -274,23 +305,59 @@ def _tensor_map_to_dict(tensor_map):
     for block_i, block in enumerate(tensor_map.blocks()):
         prefix = f"blocks/{block_i}"
 
-        result.update(_block_to_dict(block, prefix))
+        # go through the block and all its (possibly nested) gradients with an
+        # explicit stack, filling the same `result` dictionary
+        to_visit = [(prefix, block)]
+        while len(to_visit) != 0:
+            block_prefix, current = to_visit.pop()
+            _block_to_dict(current, block_prefix, result)
+
+            gradients_prefix = block_prefix + "/gradients/"
+            for parameter, gradient in current.gradients():
+                to_visit.append((gradients_prefix + parameter, gradient))
+
         result[f"{prefix}/properties"] = _labels_to_npz(block.properties)
 
     return result
 
 
-def _block_to_dict(block, prefix):
-    result = {}
-    result[f"{prefix}/values"] = _array_to_numpy(block.values)
-    result[f"{prefix}/samples"] = _labels_to_npz(block.samples)
+def _block_to_dict(block, prefix, result):
+    """
+    Add the values, samples and components of ``block`` to ``result``, but not its
+    gradients.
+    """
+    result[prefix + "/values"] = _array_to_numpy(block.values)
+    result[prefix + "/samples"] = _labels_to_npz(block.samples)
+
+    components_prefix = prefix + "/components/"
     for i, component in enumerate(block.components):
-        result[f"{prefix}/components/{i}"] = _labels_to_npz(component)
+        result[components_prefix + str(i)] = _labels_to_npz(component)
 
-    for parameter, gradient in block.gradients():
-        result.update(_block_to_dict(gradient, f"{prefix}/gradients/{parameter}"))
 
-    return result
+def _write_npz(file, arrays):
+    """
+    Write all the ``arrays`` (a dictionary of names to numpy arrays) to ``file``,
+    using the same format as ``np.savez``.
+
+    Contrary to ``np.savez``, the data of C-contiguous arrays is given directly to the
+    ZIP file, without being copied to intermediary ``bytes`` first.
+    """
+    with zipfile.ZipFile(
+        file, mode="w", compression=zipfile.ZIP_STORED, allowZip64=True
+    ) as zip_file:
+        for name, array in arrays.items():
+            array = np.ascontiguousarray(array)
+            header = np.lib.format.header_data_from_array_1_0(array)
+
+            with zip_file.open(name + ".npy", mode="w", force_zip64=True) as fd:
+                try:
+                    np.lib.format.write_array_header_1_0(fd, header)
+                except ValueError:
+                    # the header is too large for version 1.0 of the format
+                    np.lib.format.write_array_header_2_0(fd, header)
+
+                # view the data as bytes to give the right size to the ZIP file
+                fd.write(array.reshape(-1).view(np.uint8).data)
 
 
 def _labels_from_npz(data):
@@ -298,50 +365,120 @@ def _labels_from_npz(data):
     return Labels(names=names, values=data.view(dtype=np.int32).reshape(-1, len(names)))
 
 
+@functools.lru_cache(maxsize=256)
+def _labels_npz_dtype(names):
+    """Get the structured dtype used to store Labels with the given ``names``"""
+    return np.dtype([(name, np.int32) for name in names])
+
+
 def _labels_to_npz(labels):
-    dtype = [(name, np.int32) for name in labels.names]
+    dtype = _labels_npz_dtype(tuple(labels.names))
     return labels.values.view(dtype=dtype).reshape((labels.values.shape[0],))
 
 
+# minimal total size of the arrays in a npz file to decode them in parallel
+_PARALLEL_NPZ_MIN_SIZE = 64 * 1024 * 1024
+# maximal number of threads used to decode a single npz file
+_PARALLEL_NPZ_MAX_WORKERS = 4
+
+
 def _read_npz(file):
-    dictionary = np.load(file)
+    # `np.load` only reads the entries of the npz file when they are accessed, we
+    # use it as a context manager to close the underlying file as soon as we are
+    # done with it
+    with np.load(file) as npz:
+        names = list(npz.keys())
+        total_size = sum(info.file_size for info in npz.zip.infolist())
+
+        # only paths can be opened again by each thread, file-like objects are
+        # always read serially
+        parallel = (
+            isinstance(file, (str, pathlib.Path))
+            and total_size >= _PARALLEL_NPZ_MIN_SIZE
+            and len(names) > 1
+        )
+        if not parallel:
+            dictionary = {name: npz[name] for name in names}
 
+    if parallel:
+        dictionary = _read_npz_parallel(file, names)
+
+    # creating the Labels and TensorBlock goes through the C API, and is kept serial
     keys = _labels_from_npz(dictionary["keys"])
+    gradient_parameters = _gradient_parameters(dictionary.keys())
     blocks = []
 
     for block_i in range(len(keys)):
         prefix = f"blocks/{block_i}"
         properties = _labels_from_npz(dictionary[f"{prefix}/properties"])
 
-        block = _read_block(prefix, dictionary, properties)
+        block = _read_block(prefix, dictionary, properties, gradient_parameters)
         blocks.append(block)
 
     return TensorMap(keys, blocks)
 
 
-def _read_block(prefix, dictionary, properties):
-    values = dictionary[f"{prefix}/values"]
+def _read_npz_parallel(path, names):
+    """
+    Decode all the arrays called ``names`` in the npz file at ``path`` with a few
+    threads, since reading from the ZIP file and copying the data in numpy arrays
+    release the GIL.
+    """
+    n_workers = min(_PARALLEL_NPZ_MAX_WORKERS, os.cpu_count() or 1, len(names))
 
-    samples = _labels_from_npz(dictionary[f"{prefix}/samples"])
+    def read_arrays(names_subset):
+        # `ZipFile` is not thread-safe, so each thread opens the file separately
+        with np.load(path) as npz:
+            return {name: npz[name] for name in names_subset}
+
+    arrays = {}
+    with concurrent.futures.ThreadPoolExecutor(max_workers=n_workers) as executor:
+        subsets = [names[i::n_workers] for i in range(n_workers)]
+        for result in executor.map(read_arrays, subsets):
+            arrays.update(result)
+
+    # keep the same order as the entries in the file
+    return {name: arrays[name] for name in names}
+
+
+def _gradient_parameters(names):
+    """
+    Find all the gradients in the given npz entry ``names``, in a single pass. This
+    returns a dictionary from a block prefix to the list of gradient parameters
+    defined for this block.
+    """
+    parameters = {}
+    for name in names:
+        if not name.endswith("/values"):
+            continue
+
+        # gradients values are stored in "<prefix>/gradients/<parameter>/values"
+        split = name[: -len("/values")].rsplit("/gradients/", 1)
+        if len(split) == 2:
+            prefix, parameter = split
+            parameters.setdefault(prefix, []).append(parameter)
+
+    return parameters
+
+
+def _read_block(prefix, dictionary, properties, gradient_parameters):
+    values = dictionary[prefix + "/values"]
+
+    samples = _labels_from_npz(dictionary[prefix + "/samples"])
     components = []
+    components_prefix = prefix + "/components/"
     for i in range(len(values.shape) - 2):
-        components.append(_labels_from_npz(dictionary[f"{prefix}/components/{i}"]))
+        components.append(_labels_from_npz(dictionary[components_prefix + str(i)]))
 
     block = TensorBlock(values, samples, components, properties)
 
-    parameters = set()
-    gradient_prefix = f"{prefix}/gradients/"
-    for name in dictionary.keys():
-        if name.startswith(gradient_prefix) and name.endswith("/values"):
-            parameter = name[len(gradient_prefix) :]
-            parameter = parameter.split("/")[0]
-            parameters.add(parameter)
-
-    for parameter in parameters:
+    gradients_prefix = prefix + "/gradients/"
+    for parameter in gradient_parameters.get(prefix, []):
         gradient = _read_block(
-            f"{prefix}/gradients/{parameter}",
+            gradients_prefix + parameter,
             dictionary,
             properties,
+            gradient_parameters,
         )
         block.add_gradient(parameter, gradient)
 
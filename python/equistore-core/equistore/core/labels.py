@@ -1,6 +1,7 @@
 import ctypes
-import io
-from typing import List, Optional, Sequence, Tuple, Union, overload
+import functools
+import sys
+from typing import Dict, List, Optional, Sequence, Tuple, Union, overload
 
 import numpy as np
 
@@ -9,6 +10,15 @@ from ._c_lib import _get_library
 from .utils import _ptr_to_const_ndarray
 
 
+# pointer types used to pass numpy arrays to the C API, created once here instead of
+# on every call
+_c_int32_p = ctypes.POINTER(ctypes.c_int32)
+_c_int64_p = ctypes.POINTER(ctypes.c_int64)
+
+# cached instance returned by `Labels.single()`
+_SINGLE_LABELS = None
+
+
 class LabelsEntry:
     """A single entry (i.e. row) in a set of :py:class:`Labels`.
 
@@ -28,8 +38,26 @@ class LabelsEntry:
     [0 1 8]
     """
 
+    __slots__ = (
+        "_names",
+        "_values",
+        "_names_hash",
+        "_name_to_index",
+        "_labels",
+        "_index",
+    )
+
     def __init__(self, names: List[str], values: np.ndarray):
         self._names = names
+        # hash of the names, shared by all entries from the same Labels
+        self._names_hash = None
+        # mapping from names to column index, shared by all entries from the same
+        # Labels
+        self._name_to_index = None
+        # Labels containing this entry and position of the entry in them, if this
+        # entry was created from some Labels
+        self._labels = None
+        self._index = None
 
         if len(values.shape) != 1 or values.dtype != np.int32:
             raise ValueError(
@@ -38,6 +66,29 @@ class LabelsEntry:
 
         self._values = values
 
+    @classmethod
+    def _from_trusted(
+        cls,
+        names: List[str],
+        values: np.ndarray,
+        names_hash: Optional[int],
+        name_to_index: Optional[Dict[str, int]],
+        labels: "Labels",
+        index: int,
+    ) -> "LabelsEntry":
+        """
+        Create a new entry without checking the ``values``, which must be the row at
+        ``index`` in the values of ``labels``.
+        """
+        entry = cls.__new__(cls)
+        entry._names = names
+        entry._values = values
+        entry._names_hash = names_hash
+        entry._name_to_index = name_to_index
+        entry._labels = labels
+        entry._index = index
+        return entry
+
     @property
     def names(self) -> List[str]:
         """names of the dimensions for this Labels entry"""
@@ -70,9 +121,12 @@ class LabelsEntry:
         if isinstance(dimension, int):
             return self._values[dimension]
         elif isinstance(dimension, str):
+            if self._name_to_index is None:
+                self._name_to_index = _name_to_index(self._names)
+
             try:
-                i = self._names.index(dimension)
-            except ValueError:
+                i = self._name_to_index[dimension]
+            except KeyError:
                 raise ValueError(
                     f"'{dimension}' not found in the dimensions of these Labels"
                 )
@@ -95,11 +149,21 @@ class LabelsEntry:
                 f"can only compare between LabelsEntry for equality, got {type(other)}"
             )
 
-        return (
-            self._names == other._names
-            and self._values.shape == other._values.shape
-            and np.all(self._values == other._values)
-        )
+        # entries from the same Labels share the names list, and names are interned
+        # so comparing lists of names with `==` mostly compares pointers
+        if self._names is not other._names and self._names != other._names:
+            return False
+
+        # two entries at the same position in the same Labels are equal, this is
+        # cheaper to check than looking at the (short) values arrays
+        if (
+            self._labels is not None
+            and self._labels is other._labels
+            and self._index == other._index
+        ):
+            return True
+
+        return np.array_equal(self._values, other._values)
 
     def __ne__(self, other: "LabelsEntry") -> bool:
         """
@@ -108,8 +172,12 @@ class LabelsEntry:
         """
         return not self.__eq__(other)
 
-    def __hash__(self) -> None:
-        return hash(tuple(self._values) + tuple(self._names))
+    def __hash__(self) -> int:
+        if self._names_hash is None:
+            self._names_hash = hash(tuple(self._names))
+
+        # hash the raw values buffer instead of creating one Python int per value
+        return hash(self._values.tobytes()) ^ self._names_hash
 
 
 class Labels:
@@ -213,6 +281,16 @@ class Labels:
     True
     """
 
+    __slots__ = (
+        "_lib",
+        "_labels",
+        "_names",
+        "_values",
+        "_names_hash",
+        "_name_to_index",
+        "_columns",
+    )
+
     def __init__(self, names: Union[str, Sequence[str]], values: np.ndarray):
         """
         :param names: names of the dimensions in the new labels. A single string
@@ -239,25 +317,34 @@ class Labels:
                 "`names` must have an entry for each column of the `values` array"
             )
 
-        try:
-            # We need to make sure the data is C-contiguous to take a pointer to
-            # it, and that it has the right type
-            values = np.ascontiguousarray(
-                values.astype(
+        # We need to make sure the data is C-contiguous to take a pointer to it, and
+        # that it has the right type. Arrays which are already in the right format
+        # (including all arrays created by equistore itself) are used as-is.
+        if not (
+            values.dtype == np.int32
+            and values.flags.c_contiguous
+            and type(values) is np.ndarray
+        ):
+            try:
+                # `order="C"` already gives a C-contiguous array, and `copy=False`
+                # only copies when required.
+                values = values.astype(
                     np.int32,
                     order="C",
                     casting="same_kind",
                     subok=False,
                     copy=False,
                 )
-            )
-        except TypeError as e:
-            raise TypeError("Labels values must be convertible to integers") from e
+            except TypeError as e:
+                raise TypeError("Labels values must be convertible to integers") from e
 
         self._lib = _get_library()
         self._labels = _create_new_labels(self._lib, names, values)
         self._names = names
+        self._names_hash = None
+        self._name_to_index = _name_to_index(names)
         self._values = _labels_values(self._labels)
+        self._columns = None
 
     @staticmethod
     def single() -> "Labels":
@@ -265,8 +352,17 @@ class Labels:
         Create :py:class:`Labels` to use when there is no relevant metadata and
         only one entry in the corresponding dimension (e.g. keys when a tensor
         map contains a single block).
+
+        Since :py:class:`Labels` are immutable, the same instance is returned by all
+        calls to this function.
         """
-        return Labels(names=["_"], values=np.zeros(shape=(1, 1), dtype=np.int32))
+        global _SINGLE_LABELS
+        if _SINGLE_LABELS is None:
+            _SINGLE_LABELS = Labels._from_trusted_values(
+                names=["_"], values=np.zeros(shape=(1, 1), dtype=np.int32)
+            )
+
+        return _SINGLE_LABELS
 
     @staticmethod
     def empty(names: Union[str, Sequence[str]]) -> "Labels":
@@ -277,7 +373,10 @@ class Labels:
                       is transformed into a list with one element, i.e.
                       ``names="a"`` is the same as ``names=["a"]``.
         """
-        return Labels(names=names, values=np.array([]))
+        names = _normalize_names_type(names)
+        return Labels._from_trusted_values(
+            names=names, values=np.zeros((0, len(names)), dtype=np.int32)
+        )
 
     @staticmethod
     def range(name: str, end: int) -> "Labels":
@@ -301,11 +400,31 @@ class Labels:
          [5]
          [6]]
         """
-        return Labels(
-            names=[name],
+        return Labels._from_trusted_values(
+            names=_normalize_names_type([name]),
             values=np.arange(end, dtype=np.int32).reshape(-1, 1),
         )
 
+    @classmethod
+    def _from_trusted_values(cls, names: List[str], values: np.ndarray):
+        """
+        Create :py:class:`Labels` without validating the inputs. ``names`` must be a
+        list of strings, and ``values`` a C-contiguous 2-dimensional array of 32-bit
+        integers with one column for each name.
+        """
+        obj = cls.__new__(cls)
+        obj._lib = _get_library()
+        obj._labels = _create_new_labels(obj._lib, names, values)
+
+        obj._names = names
+        obj._names_hash = None
+        obj._name_to_index = _name_to_index(names)
+
+        obj._values = _labels_values(obj._labels)
+        obj._columns = None
+
+        return obj
+
     @classmethod
     def _from_eqs_labels_t(cls, labels: eqs_labels_t):
         assert labels.internal_ptr_ is not None
@@ -314,12 +433,12 @@ class Labels:
         obj._lib = _get_library()
         obj._labels = labels
 
-        names = []
-        for i in range(labels.size):
-            names.append(labels.names[i].decode("utf8"))
-        obj._names = names
+        obj._names = [sys.intern(n.decode("utf8")) for n in labels.names[: labels.size]]
+        obj._names_hash = None
+        obj._name_to_index = _name_to_index(obj._names)
 
         obj._values = _labels_values(obj._labels)
+        obj._columns = None
 
         return obj
 
@@ -355,8 +474,14 @@ class Labels:
         return self._values.shape[0]
 
     def __iter__(self):
-        for i in range(len(self)):
-            yield LabelsEntry(self._names, self._values[i, :])
+        # iterating over the 2D array directly lets numpy create the row views
+        names = self._names
+        names_hash = self._get_names_hash()
+        name_to_index = self._name_to_index
+        for index, values in enumerate(self._values):
+            yield LabelsEntry._from_trusted(
+                names, values, names_hash, name_to_index, self, index
+            )
 
     @overload
     def __getitem__(self, dimension: str) -> np.ndarray:
@@ -392,7 +517,7 @@ class Labels:
                 "can not call `__contains__` on a Labels view, call `to_owned` before"
             )
 
-        return self.position(entry) is not None
+        return self._position(entry) is not None
 
     def __eq__(self, other: "Labels") -> bool:
         """
@@ -404,11 +529,15 @@ class Labels:
                 f"can only compare between Labels for equality, got {type(other)}"
             )
 
-        return (
-            self._names == other._names
-            and self._values.shape == other._values.shape
-            and np.all(self._values == other._values)
-        )
+        # entries from the same Labels share the names list, and names are interned
+        # so comparing lists of names with `==` mostly compares pointers
+        if self._names is not other._names and self._names != other._names:
+            return False
+
+        if _same_buffer(self._values, other._values):
+            return True
+
+        return np.array_equal(self._values, other._values)
 
     def __ne__(self, other: "Labels") -> bool:
         """
@@ -417,6 +546,12 @@ class Labels:
         """
         return not self.__eq__(other)
 
+    def _get_names_hash(self) -> int:
+        """Get the hash of the names, shared with all the entries of these Labels"""
+        if self._names_hash is None:
+            self._names_hash = hash(tuple(self._names))
+        return self._names_hash
+
     def _as_eqs_labels_t(self):
         if self.is_view():
             raise ValueError(
@@ -459,15 +594,88 @@ class Labels:
                 "can not call `position` on a Labels view, call `to_owned` before"
             )
 
-        result = ctypes.c_int64()
-        c_entry = ctypes.ARRAY(ctypes.c_int32, len(entry))()
-        for i, v in enumerate(entry):
-            c_entry[i] = ctypes.c_int32(v)
+        return self._position(entry)
+
+    def positions(self, entries: np.ndarray) -> np.ndarray:
+        """
+        Get the positions of multiple ``entries`` in this set of :py:class:`Labels`,
+        as an array of 64-bit integers. Entries which are not present in the labels
+        get ``-1`` as their position.
+
+        This is equivalent to calling :py:func:`Labels.position` on each row of
+        ``entries``, but instead of one lookup per row, the unique rows of
+        ``entries`` are found with ``np.unique`` and stored in new
+        :py:class:`Labels`. The positions are then found with a single
+        :py:func:`Labels.intersection_and_mapping` between these
+        :py:class:`Labels` and ``self``.
+
+        >>> import numpy as np
+        >>> from equistore import Labels
+        >>> labels = Labels(names=["a", "b"], values=np.array([[0, 1], [1, 2], [0, 3]]))
+        >>> print(labels.positions(np.array([[0, 3], [4, 4], [0, 1]])))
+        [ 2 -1  0]
+        """
+        if self.is_view():
+            raise ValueError(
+                "can not call `positions` on a Labels view, call `to_owned` before"
+            )
+
+        if not isinstance(entries, np.ndarray):
+            raise ValueError("`entries` must be a numpy ndarray")
+
+        if len(entries.shape) != 2 or entries.shape[1] != len(self._names):
+            raise ValueError(
+                "`entries` must be a 2D array with one column for each dimension of "
+                "these Labels"
+            )
+
+        if entries.shape[0] == 0:
+            return np.empty(0, dtype=np.int64)
+
+        try:
+            entries = entries.astype(np.int32, casting="same_kind", copy=False)
+        except TypeError as e:
+            raise TypeError("Labels entries must be convertible to integers") from e
+
+        # the entries might contain duplicates, which are not allowed in Labels
+        unique, inverse = np.unique(entries, axis=0, return_inverse=True)
+        queries = Labels._from_trusted_values(self._names, np.ascontiguousarray(unique))
+
+        # both mappings give positions in the intersection, which we use to find
+        # the position in `self` of each unique entry
+        intersection, mapping, queries_mapping = self.intersection_and_mapping(queries)
+        present = mapping >= 0
+
+        positions_in_self = np.empty(len(intersection), dtype=np.int64)
+        positions_in_self[mapping[present]] = np.nonzero(present)[0]
+
+        positions = np.full(len(queries), -1, dtype=np.int64)
+        found = queries_mapping >= 0
+        positions[found] = positions_in_self[queries_mapping[found]]
+
+        return positions[inverse.reshape(-1)]
+
+    def _position(self, entry: Union[LabelsEntry, Sequence[int]]) -> Optional[int]:
+        """Implementation of :py:func:`Labels.position`, without the view check"""
+        if isinstance(entry, LabelsEntry):
+            # already a 1-dimensional array of int32
+            values = np.ascontiguousarray(entry._values)
+        elif (
+            isinstance(entry, np.ndarray)
+            and entry.dtype == np.int32
+            and len(entry.shape) == 1
+            and entry.flags.c_contiguous
+        ):
+            # can be passed to C as-is
+            values = entry
+        else:
+            values = _entry_to_int32_array(entry)
 
+        result = ctypes.c_int64()
         self._lib.eqs_labels_position(
             self._labels,
-            c_entry,
-            c_entry._length_,
+            values.ctypes.data_as(_c_int32_p),
+            values.shape[0],
             result,
         )
 
@@ -503,7 +711,7 @@ class Labels:
 
         output = eqs_labels_t()
         self._lib.eqs_labels_union(
-            self._as_eqs_labels_t(), other._as_eqs_labels_t(), output, None, 0, None, 0
+            self._labels, other._labels, output, None, 0, None, 0
         )
 
         return Labels._from_eqs_labels_t(output)
@@ -547,16 +755,16 @@ class Labels:
             )
 
         output = eqs_labels_t()
-        first_mapping = np.zeros(len(self), dtype=np.int64)
-        second_mapping = np.zeros(len(other), dtype=np.int64)
+        first_mapping = np.empty(len(self), dtype=np.int64)
+        second_mapping = np.empty(len(other), dtype=np.int64)
 
         self._lib.eqs_labels_union(
-            self._as_eqs_labels_t(),
-            other._as_eqs_labels_t(),
+            self._labels,
+            other._labels,
             output,
-            first_mapping.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
+            first_mapping.ctypes.data_as(_c_int64_p),
             len(first_mapping),
-            second_mapping.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
+            second_mapping.ctypes.data_as(_c_int64_p),
             len(second_mapping),
         )
 
@@ -587,7 +795,7 @@ class Labels:
 
         output = eqs_labels_t()
         self._lib.eqs_labels_intersection(
-            self._as_eqs_labels_t(), other._as_eqs_labels_t(), output, None, 0, None, 0
+            self._labels, other._labels, output, None, 0, None, 0
         )
 
         return Labels._from_eqs_labels_t(output)
@@ -630,16 +838,16 @@ class Labels:
             )
 
         output = eqs_labels_t()
-        first_mapping = np.zeros(len(self), dtype=np.int64)
-        second_mapping = np.zeros(len(other), dtype=np.int64)
+        first_mapping = np.empty(len(self), dtype=np.int64)
+        second_mapping = np.empty(len(other), dtype=np.int64)
 
         self._lib.eqs_labels_intersection(
-            self._as_eqs_labels_t(),
-            other._as_eqs_labels_t(),
+            self._labels,
+            other._labels,
             output,
-            first_mapping.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
+            first_mapping.ctypes.data_as(_c_int64_p),
             len(first_mapping),
-            second_mapping.ctypes.data_as(ctypes.POINTER(ctypes.c_int64)),
+            second_mapping.ctypes.data_as(_c_int64_p),
             len(second_mapping),
         )
 
@@ -666,7 +874,20 @@ class Labels:
 
             :py:func:`Labels.__getitem__` as the main way to use this function
         """
-        return LabelsEntry(self._names, self._values[index, :])
+        values = self._values[index]
+
+        index = int(index)
+        if index < 0:
+            index += self._values.shape[0]
+
+        return LabelsEntry._from_trusted(
+            self._names,
+            values,
+            self._get_names_hash(),
+            self._name_to_index,
+            self,
+            index,
+        )
 
     def column(self, dimension: str) -> np.ndarray:
         """
@@ -685,13 +906,25 @@ class Labels:
             )
 
         try:
-            index = self.names.index(dimension)
-        except ValueError:
+            index = self._name_to_index[dimension]
+        except KeyError:
             raise ValueError(
                 f"'{dimension}' not found in the dimensions of these Labels"
             )
 
-        return self.values[:, index]
+        if self._columns is None:
+            # the first call returns a strided view inside the values, and
+            # following calls use a contiguous copy of the transposed values
+            # instead. This way, code accessing a single column does not pay for
+            # the copy, while repeated accesses get a unit-stride array.
+            self._columns = False
+            return self._values[:, index]
+        elif self._columns is False:
+            columns = np.ascontiguousarray(self._values.T)
+            columns.flags.writeable = False
+            self._columns = columns
+
+        return self._columns[index]
 
     def view(self, dimensions: Union[str, Sequence[str]]) -> "Labels":
         """
@@ -704,23 +937,23 @@ class Labels:
         """
 
         names = _normalize_names_type(dimensions)
-        indices = []
-        for name in names:
-            try:
-                i = self.names.index(name)
-                indices.append(i)
-            except ValueError:
-                raise ValueError(
-                    f"'{name}' not found in the dimensions of these Labels"
-                )
+        try:
+            indices = [self._name_to_index[name] for name in names]
+        except KeyError as e:
+            raise ValueError(
+                f"'{e.args[0]}' not found in the dimensions of these Labels"
+            )
 
-        values = self.values[:, indices]
+        values = self._values[:, indices]
 
         obj = self.__new__(Labels)
         obj._lib = _get_library()
         obj._labels = None
         obj._names = names
+        obj._names_hash = None
+        obj._name_to_index = _name_to_index(names)
         obj._values = values
+        obj._columns = None
 
         return obj
 
@@ -735,21 +968,22 @@ class Labels:
 
     def to_owned(self) -> "Labels":
         """convert a view to owned labels, which implement the full API"""
-        labels = _create_new_labels(self._lib, self._names, self._values)
-        return Labels._from_eqs_labels_t(labels)
+        # views created with multiple columns are not C-contiguous
+        values = np.ascontiguousarray(self._values)
+        return Labels._from_trusted_values(list(self._names), values)
 
 
 def _normalize_names_type(names: Union[str, Sequence[str]]) -> List[str]:
     """
     Transform Labels names from any of the accepted types into the canonical
-    representation (list of strings).
+    representation (list of interned strings).
     """
 
     if isinstance(names, str):
         if len(names) == 0:
             names = []
         else:
-            names = [names]
+            names = [sys.intern(names)]
     else:
         try:
             names = list(names)
@@ -764,21 +998,67 @@ def _normalize_names_type(names: Union[str, Sequence[str]]) -> List[str]:
                     f"Labels names must be strings, got {type(name)} instead"
                 )
 
+        names = [sys.intern(name) for name in names]
+
     return names
 
 
-def _create_new_labels(lib, names: List[str], values: np.ndarray) -> eqs_labels_t:
-    labels = eqs_labels_t()
+def _same_buffer(first: np.ndarray, second: np.ndarray) -> bool:
+    """
+    Check if the two arrays view the exact same memory (same data pointer, shape
+    and strides), in which case they are equal without having to look at the data.
+    """
+    return (
+        first.shape == second.shape
+        and first.strides == second.strides
+        and first.ctypes.data == second.ctypes.data
+    )
+
+
+def _name_to_index(names: List[str]) -> Dict[str, int]:
+    """Get a dictionary mapping each name to the corresponding column index"""
+    return {name: i for i, name in enumerate(names)}
+
 
+def _entry_to_int32_array(entry: Sequence[int]) -> np.ndarray:
+    """
+    Convert a single Labels entry given as a sequence of integers to a contiguous
+    1-dimensional array of 32-bit integers.
+    """
+    values = np.asarray(entry)
+    if len(values.shape) != 1:
+        raise ValueError("Labels entry must be a 1-dimensional sequence of integers")
+
+    if values.shape[0] == 0:
+        # numpy uses float64 for empty sequences
+        return np.empty(0, dtype=np.int32)
+
+    try:
+        return values.astype(np.int32, order="C", casting="same_kind", copy=False)
+    except TypeError as e:
+        raise TypeError("Labels entry must be convertible to integers") from e
+
+
+@functools.lru_cache(maxsize=256)
+def _encode_names(names: Tuple[str, ...]):
+    """
+    Get the ``names`` as an array of C strings. This array is only read by
+    ``eqs_labels_create``, so it can be shared between all the labels created with
+    the same names.
+    """
     c_names = ctypes.ARRAY(ctypes.c_char_p, len(names))()
-    for i, n in enumerate(names):
-        c_names[i] = n.encode("utf8")
+    c_names[:] = [n.encode("utf8") for n in names]
+    return c_names
+
+
+def _create_new_labels(lib, names: List[str], values: np.ndarray) -> eqs_labels_t:
+    labels = eqs_labels_t()
 
     labels.internal_ptr_ = None
-    labels.names = c_names
+    labels.names = _encode_names(tuple(names))
     labels.size = len(names)
 
-    labels.values = values.ctypes.data_as(ctypes.POINTER(ctypes.c_int32))
+    labels.values = values.ctypes.data_as(_c_int32_p)
     labels.count = values.shape[0]
     lib.eqs_labels_create(labels)
 
@@ -795,19 +1075,76 @@ def _labels_values(labels: eqs_labels_t):
     return _ptr_to_const_ndarray(labels.values, (labels.count, labels.size), np.int32)
 
 
-def _print_string_center(output, string, width, last):
+def _center_string(string: str, width: int) -> str:
     delta = width - len(string)
     n_before = delta // 2
     n_after = delta - n_before
 
-    if last:
-        # don't add spaces after the last element
-        output.write(" " * n_before)
-        output.write(string)
-    else:
-        output.write(" " * n_before)
-        output.write(string)
-        output.write(" " * n_after)
+    # this puts the extra space after the string when delta is odd, which is not
+    # what `str.center` does
+    return " " * n_before + string + " " * n_after
+
+
+def _format_row(strings: List[str], widths: List[int]) -> str:
+    """center all the ``strings`` in their column, and join them in a single line"""
+    row = "".join([_center_string(s, w) for s, w in zip(strings, widths)])
+    # don't add spaces after the last element
+    return row.rstrip(" ")
+
+
+def _format_rows(values: np.ndarray, widths: List[int], indent: int) -> str:
+    """
+    Format all the rows in the 2-dimensional ``values`` array in the same way as
+    :py:func:`_format_row`, with ``indent`` spaces before and a new line after each
+    row. Instead of formatting each value separately, this writes the characters for
+    all values directly in an array of bytes.
+    """
+    n_rows, n_columns = values.shape
+    if n_rows == 0:
+        return ""
+
+    # ASCII representation of the values, padded with NUL bytes. 11 characters are
+    # enough for all 32-bit integers.
+    chars = values.astype("S11").view(np.uint8).reshape(n_rows, n_columns, 11)
+    lengths = np.count_nonzero(chars, axis=2)
+
+    output = np.full((n_rows, indent + sum(widths) + 1), ord(" "), dtype=np.uint8)
+    rows = np.arange(n_rows)
+
+    start = indent
+    end = np.full(n_rows, indent)
+    for column, width in enumerate(widths):
+        length = lengths[:, column]
+        # same as `_center_string`
+        position = start + (width - length) // 2
+        for k in range(int(length.max())):
+            mask = k < length
+            output[rows[mask], position[mask] + k] = chars[mask, column, k]
+
+        start += width
+        end = position + length
+
+    # don't add spaces after the last element, removing everything after the new
+    # line in each row
+    output[rows, end] = ord("\n")
+    output[np.arange(output.shape[1]) > end[:, None]] = 0
+
+    return output.tobytes().replace(b"\0", b"").decode("ascii")
+
+
+# powers of ten used to count the number of digits in `_column_widths`
+_POWERS_OF_TEN = 10 ** np.arange(1, 11, dtype=np.int64)
+
+
+def _column_widths(values: np.ndarray) -> np.ndarray:
+    """
+    Get the maximal number of characters used by ``str(value)`` in each column of
+    the 2-dimensional ``values`` array of 32-bit integers, without converting all
+    the values to strings.
+    """
+    values = values.astype(np.int64)
+    n_digits = np.searchsorted(_POWERS_OF_TEN, np.abs(values), side="right") + 1
+    return (n_digits + (values < 0)).max(axis=0)
 
 
 def _print_labels(
@@ -821,27 +1158,13 @@ def _print_labels(
     # plus 2, might be wider for large values)                                         #
     # ================================================================================ #
 
-    # the +2 is here use at least one space on each side of the name
-    widths = [len(n) + 2 for n in names]
-
-    # first set of values to print (before the "...")
-    values_first = []
-    # second set of values to print (after the "...")
-    values_second = []
-
     n_elements = values.shape[0]
 
-    # first, determine the width of each column by looking through all the
-    # values and names lengths
     if max_entries < 0 or n_elements <= max_entries:
-        for entry in values:
-            entry_strings = []
-            for i, e in enumerate(entry):
-                element_str = str(e)
-                entry_strings.append(element_str)
-                widths[i] = max(widths[i], len(element_str) + 2)
-
-            values_first.append(entry_strings)
+        # first set of values to print (before the "...")
+        values_first = values
+        # second set of values to print (after the "...")
+        values_second = values[:0, :]
     else:
         if max_entries < 2:
             max_entries = 2
@@ -849,46 +1172,23 @@ def _print_labels(
         n_after = max_entries // 2
         n_before = max_entries - n_after
 
-        # values before the "..."
-        for entry in values[:n_before, :]:
-            entry_strings = []
-            for i, e in enumerate(entry):
-                element_str = str(e)
-                entry_strings.append(element_str)
-                widths[i] = max(widths[i], len(element_str) + 2)
-
-            values_first.append(entry_strings)
-
-        # values after the "..."
-        for entry in values[n_elements - n_after :, :]:
-            entry_strings = []
-            for i, e in enumerate(entry):
-                element_str = str(e)
-                entry_strings.append(element_str)
-                widths[i] = max(widths[i], len(element_str) + 2)
+        values_first = values[:n_before, :]
+        values_second = values[n_elements - n_after :, :]
 
-            values_second.append(entry_strings)
+    # the +2 is here use at least one space on each side of the name/values
+    widths = [len(n) + 2 for n in names]
+    printed = np.concatenate([values_first, values_second])
+    if printed.shape[0] != 0:
+        values_widths = _column_widths(printed) + 2
+        widths = [max(w, int(v)) for w, v in zip(widths, values_widths)]
 
     # ================================================================================ #
-    # Step 2: actually create the output string, using io.StringIO to incrementally    #
-    # append to the output                                                             #
+    # Step 2: actually create the output string, accumulating all the lines in a list  #
+    # and joining them at the end                                                      #
     # ================================================================================ #
 
-    indent_str = " " * indent
-    n_dimensions = values.shape[1]
-
-    output = io.StringIO()
-    for i in range(n_dimensions):
-        last = i == n_dimensions - 1
-        _print_string_center(output, names[i], widths[i], last)
-    output.write("\n")
-
-    for strings in values_first:
-        output.write(indent_str)
-        for i in range(n_dimensions):
-            last = i == n_dimensions - 1
-            _print_string_center(output, strings[i], widths[i], last)
-        output.write("\n")
+    output = [_format_row(names, widths), "\n"]
+    output.append(_format_rows(values_first, widths, indent))
 
     if len(values_second) != 0:
         half_header_widths = sum(widths) // 2
@@ -896,17 +1196,9 @@ def _print_labels(
             # 3 characters in '...'
             half_header_widths -= 3
 
-        output.write(indent_str)
-        output.write((half_header_widths + 1) * " ")
-        output.write("...\n")
-
-        for strings in values_second:
-            output.write(indent_str)
-            for i in range(n_dimensions):
-                last = i == n_dimensions - 1
-                _print_string_center(output, strings[i], widths[i], last)
-            output.write("\n")
+        output.append(" " * indent + (half_header_widths + 1) * " " + "...\n")
+        output.append(_format_rows(values_second, widths, indent))
 
-    output = output.getvalue()
+    output = "".join(output)
     assert output[-1] == "\n"
     return output[:-1]
@@ -12,10 +12,27 @@ import numpy as np
 from ._c_api import c_uintptr_t, eqs_block_t, eqs_labels_t
 from ._c_lib import _get_library
 from .block import TensorBlock
-from .labels import Labels, LabelsEntry
+from .labels import (
+    Labels,
+    LabelsEntry,
+    _c_int32_p,
+    _encode_names,
+    _normalize_names_type,
+)
 from .status import _check_pointer
 
 
+# pointer to a block, created once here instead of on every call
+_eqs_block_p = ctypes.POINTER(eqs_block_t)
+
+# range of values allowed in block selections
+_INT32_MIN = np.iinfo(np.int32).min
+_INT32_MAX = np.iinfo(np.int32).max
+
+# cached `equistore.operations` module, see `_operations()`
+_OPERATIONS = None
+
+
 class TensorMap:
     """
     A TensorMap is the main user-facing class of this library, and can store any kind of
@@ -48,19 +65,21 @@ class TensorMap:
         :param keys: keys associated with each block
         :param blocks: set of blocks containing the actual data
         """
-        assert isinstance(keys, Labels)
+        if not isinstance(keys, Labels):
+            raise TypeError(f"`keys` must be Labels, got {type(keys)} instead")
 
         self._lib = _get_library()
 
-        blocks_array_t = ctypes.POINTER(eqs_block_t) * len(blocks)
-        blocks_array = blocks_array_t(*[block._ptr for block in blocks])
-
-        for block in blocks:
+        # check all the blocks before moving any of them, collecting the pointers
+        # in the same loop
+        blocks_array = (_eqs_block_p * len(blocks))()
+        for i, block in enumerate(blocks):
             if block._parent is not None:
                 raise ValueError(
                     "can not use blocks from another tensor map in a new one, "
                     "use TensorBlock.copy() to make a copy of each block first"
                 )
+            blocks_array[i] = block._ptr
 
         # all blocks are moved into the tensor map, assign NULL to `block._ptr` to
         # prevent accessing invalid data from Python and double free
@@ -75,6 +94,11 @@ class TensorMap:
         for block in blocks:
             block._is_inside_map = True
 
+        # keys and metadata names are fetched from the C API on first access, see
+        # `TensorMap.keys` and `TensorMap._first_block_names`
+        self._keys = None
+        self._names = None
+
     @staticmethod
     def _from_ptr(ptr):
         """Create a tensor map from a pointer owning its data"""
@@ -83,6 +107,8 @@ class TensorMap:
         obj._lib = _get_library()
         obj._ptr = ptr
         obj._blocks = []
+        obj._keys = None
+        obj._names = None
         return obj
 
     @classmethod
@@ -118,7 +144,11 @@ class TensorMap:
     def __reduce_ex__(self, protocol: int):
         """
         Used by the Pickler to dump TensorMap object to bytes object. When protocol >= 5
-        it supports PickleBuffer which reduces number of copies needed
+        it supports PickleBuffer which reduces number of copies needed.
+
+        With older protocols, the serialized data has to be copied once into a
+        ``bytes`` object, temporarily doubling the memory used for it. Use
+        ``protocol=5`` when pickling large tensor maps to avoid this copy.
         """
         import equistore.core
 
@@ -126,7 +156,9 @@ class TensorMap:
         if protocol >= 5:
             return self._from_pickle, (PickleBuffer(buffer),)
         else:
-            return self._from_pickle, (buffer.raw,)
+            # `buffer` is a bytearray, which supports the buffer protocol and is
+            # copied exactly once here
+            return self._from_pickle, (bytes(buffer),)
 
     def __len__(self):
         return len(self.keys)
@@ -142,49 +174,31 @@ class TensorMap:
         return self.block(selection)
 
     def __eq__(self, other):
-        from equistore.operations import equal
-
-        return equal(self, other)
+        return _operations().equal(self, other)
 
     def __ne__(self, other):
-        from equistore.operations import equal
-
-        return not equal(self, other)
+        return not _operations().equal(self, other)
 
     def __add__(self, other):
-        from equistore.operations import add
-
-        return add(self, other)
+        return _operations().add(self, other)
 
     def __sub__(self, other):
-        from equistore.operations import subtract
-
-        return subtract(self, other)
+        return _operations().subtract(self, other)
 
     def __mul__(self, other):
-        from equistore.operations import multiply
-
-        return multiply(self, other)
+        return _operations().multiply(self, other)
 
     def __matmul__(self, other):
-        from equistore.operations import dot
-
-        return dot(self, other)
+        return _operations().dot(self, other)
 
     def __truediv__(self, other):
-        from equistore.operations import divide
-
-        return divide(self, other)
+        return _operations().divide(self, other)
 
     def __pow__(self, other):
-        from equistore.operations import pow
-
-        return pow(self, other)
+        return _operations().pow(self, other)
 
     def __neg__(self):
-        from equistore.operations import multiply
-
-        return multiply(self, -1)
+        return _operations().multiply(self, -1)
 
     def __pos__(self):
         return self
@@ -192,9 +206,13 @@ class TensorMap:
     @property
     def keys(self) -> Labels:
         """The set of keys labeling the blocks in this tensor map."""
-        result = eqs_labels_t()
-        self._lib.eqs_tensormap_keys(self._ptr, result)
-        return Labels._from_eqs_labels_t(result)
+        # TensorMap are immutable, so the keys can be cached after the first access
+        if self._keys is None:
+            result = eqs_labels_t()
+            self._lib.eqs_tensormap_keys(self._ptr, result)
+            self._keys = Labels._from_eqs_labels_t(result)
+
+        return self._keys
 
     def block_by_id(self, index: int) -> TensorBlock:
         """
@@ -202,16 +220,9 @@ class TensorMap:
 
         :param index: index of the block to retrieve
         """
-        if index >= len(self):
-            # we need to raise IndexError to make sure TensorMap supports iterations
-            # over blocks with `for block in tensor:` which calls `__getitem__` with
-            # integers from 0 to whenever IndexError is raised.
-            raise IndexError(
-                f"block index out of bounds: we have {len(self)} blocks but the "
-                f"index is {index}"
-            )
+        _check_block_index(index, len(self))
 
-        block = ctypes.POINTER(eqs_block_t)()
+        block = _eqs_block_p()
         self._lib.eqs_tensormap_block_by_id(self._ptr, block, index)
         return TensorBlock._from_ptr(block, parent=self)
 
@@ -221,7 +232,20 @@ class TensorMap:
 
         :param indices: indices of the block to retrieve
         """
-        return [self.block_by_id(i) for i in indices]
+        # there is no function to get multiple blocks at once in the C API, so we
+        # only do the setup once and then call `eqs_tensormap_block_by_id` in a loop
+        n_blocks = len(self)
+        block_by_id = self._lib.eqs_tensormap_block_by_id
+
+        blocks = []
+        for index in indices:
+            _check_block_index(index, n_blocks)
+
+            block = _eqs_block_p()
+            block_by_id(self._ptr, block, index)
+            blocks.append(TensorBlock._from_ptr(block, parent=self))
+
+        return blocks
 
     def blocks_matching(self, selection: Labels) -> List[int]:
         """
@@ -233,6 +257,29 @@ class TensorMap:
 
         The ``selection`` should contain a single entry.
         """
+        return self._blocks_matching_c(selection._as_eqs_labels_t())
+
+    def _blocks_matching(self, selection: Union[Labels, LabelsEntry]) -> List[int]:
+        """
+        Same as :py:func:`TensorMap.blocks_matching`, also accepting a single
+        :py:class:`LabelsEntry` as the ``selection``
+        """
+        if isinstance(selection, Labels):
+            return self.blocks_matching(selection)
+
+        # fill the eqs_labels_t directly from the entry instead of creating new
+        # Labels, the C API will copy the data
+        values = np.ascontiguousarray(selection.values)
+        c_selection = eqs_labels_t()
+        c_selection.internal_ptr_ = None
+        c_selection.names = _encode_names(tuple(selection.names))
+        c_selection.size = len(selection.names)
+        c_selection.values = values.ctypes.data_as(_c_int32_p)
+        c_selection.count = 1
+
+        return self._blocks_matching_c(c_selection)
+
+    def _blocks_matching_c(self, selection: eqs_labels_t) -> List[int]:
         block_indexes = ctypes.ARRAY(c_uintptr_t, len(self.keys))()
         count = c_uintptr_t(block_indexes._length_)
 
@@ -240,14 +287,11 @@ class TensorMap:
             self._ptr,
             block_indexes,
             count,
-            selection._as_eqs_labels_t(),
+            selection,
         )
 
-        result = []
-        for i in range(count.value):
-            result.append(int(block_indexes[i]))
-
-        return result
+        # slicing the ctypes array directly gives a list of Python int
+        return block_indexes[: count.value]
 
     def block(
         self,
@@ -322,21 +366,24 @@ class TensorMap:
             return self.block(kwargs)
         elif isinstance(selection, int):
             return self.block_by_id(selection)
+        elif _is_key_of(selection, self):
+            # entries from the keys of this tensor map know which block they match
+            return self.block_by_id(selection._index)
         else:
             selection = _normalize_selection(selection)
 
-        matching = self.blocks_matching(selection)
+        matching = self._blocks_matching(selection)
 
         if len(matching) == 0:
             if len(self.keys) == 0:
                 raise ValueError("there are no blocks in this TensorMap")
             else:
                 raise ValueError(
-                    f"couldn't find any block matching {selection[0].print()}"
+                    f"couldn't find any block matching {_print_selection(selection)}"
                 )
         elif len(matching) > 1:
             raise ValueError(
-                f"more than one block matched {selection[0].print()}, "
+                f"more than one block matched {_print_selection(selection)}, "
                 "use `TensorMap.blocks` to get all of them"
             )
         else:
@@ -380,10 +427,12 @@ class TensorMap:
             return self.blocks(kwargs)
         elif isinstance(selection, int):
             return [self.block_by_id(selection)]
+        elif _is_key_of(selection, self):
+            return [self.block_by_id(selection._index)]
         else:
             selection = _normalize_selection(selection)
 
-        matching = self.blocks_matching(selection)
+        matching = self._blocks_matching(selection)
 
         if len(self.keys) == 0:
             # return an empty list here instead of the top of this function to make sure
@@ -392,7 +441,7 @@ class TensorMap:
 
         if len(matching) == 0:
             raise ValueError(
-                f"Couldn't find any block matching '{selection[0].print()}'"
+                f"Couldn't find any block matching '{_print_selection(selection)}'"
             )
         else:
             return self.blocks_by_id(matching)
@@ -511,29 +560,51 @@ class TensorMap:
         )
         return TensorMap._from_ptr(ptr)
 
+    def _first_block_names(self):
+        """
+        Get the samples, components and properties names of the first block, which
+        are the same for all blocks. They are cached as tuples after the first call,
+        and are all :py:obj:`None` if this tensor map is empty.
+        """
+        if self._names is None:
+            if len(self.keys) == 0:
+                self._names = (None, None, None)
+            else:
+                block = self.block_by_id(0)
+                self._names = (
+                    tuple(block.samples.names),
+                    tuple(tuple(c.names) for c in block.components),
+                    tuple(block.properties.names),
+                )
+
+        return self._names
+
     @property
     def sample_names(self) -> Tuple[str]:
         """names of the sample labels for all blocks in this tensor map"""
-        if len(self.keys) == 0:
+        names = self._first_block_names()[0]
+        if names is None:
             return tuple()
 
-        return self.block(0).samples.names
+        return list(names)
 
     @property
     def components_names(self) -> List[Tuple[str]]:
         """names of the component labels for all blocks in this tensor map"""
-        if len(self.keys) == 0:
+        names = self._first_block_names()[1]
+        if names is None:
             return []
 
-        return [c.names for c in self.block(0).components]
+        return [list(c) for c in names]
 
     @property
     def property_names(self) -> Tuple[str]:
         """names of the property labels for all blocks in this tensor map"""
-        if len(self.keys) == 0:
+        names = self._first_block_names()[2]
+        if names is None:
             return tuple()
 
-        return self.block(0).properties.names
+        return list(names)
 
     def print(self, max_keys: int) -> str:
         """
@@ -549,13 +620,42 @@ class TensorMap:
         return result
 
 
+def _operations():
+    """
+    Get the ``equistore.operations`` module. It can not be imported when loading
+    this module because ``equistore.operations`` depends on ``equistore.core``, so
+    it is imported on first use and then cached.
+    """
+    global _OPERATIONS
+    if _OPERATIONS is None:
+        import equistore.operations
+
+        _OPERATIONS = equistore.operations
+
+    return _OPERATIONS
+
+
+def _check_block_index(index: int, n_blocks: int):
+    if index >= n_blocks:
+        # we need to raise IndexError to make sure TensorMap supports iterations
+        # over blocks with `for block in tensor:` which calls `__getitem__` with
+        # integers from 0 to whenever IndexError is raised.
+        raise IndexError(
+            f"block index out of bounds: we have {n_blocks} blocks but the "
+            f"index is {index}"
+        )
+
+
 def _normalize_keys_to_move(keys_to_move: Union[str, Sequence[str], Labels]) -> Labels:
     if isinstance(keys_to_move, str):
         keys_to_move = (keys_to_move,)
 
     if not isinstance(keys_to_move, Labels):
         for key in keys_to_move:
-            assert isinstance(key, str)
+            if not isinstance(key, str):
+                raise TypeError(
+                    f"`keys_to_move` must be strings, got {type(key)} instead"
+                )
 
         keys_to_move = Labels(
             names=keys_to_move,
@@ -565,22 +665,57 @@ def _normalize_keys_to_move(keys_to_move: Union[str, Sequence[str], Labels]) ->
     return keys_to_move
 
 
+def _is_key_of(selection, tensor: TensorMap) -> bool:
+    """Check if ``selection`` is an entry taken from the keys of ``tensor``"""
+    return (
+        isinstance(selection, LabelsEntry)
+        and tensor._keys is not None
+        and selection._labels is tensor._keys
+    )
+
+
+def _print_selection(selection: Union[Labels, LabelsEntry]) -> str:
+    if isinstance(selection, Labels):
+        return selection[0].print()
+    else:
+        return selection.print()
+
+
 def _list_or_str_to_array_c_char(strings: Union[str, Sequence[str]]):
     if isinstance(strings, str):
         strings = [strings]
 
-    c_strings = ctypes.ARRAY(ctypes.c_char_p, len(strings))()
-    for i, v in enumerate(strings):
-        assert isinstance(v, str)
-        c_strings[i] = v.encode("utf8")
+    encoded = []
+    for v in strings:
+        if not isinstance(v, str):
+            raise TypeError(f"expected a list of strings, got {type(v)} in the list")
+        encoded.append(v.encode("utf8"))
+
+    c_strings = ctypes.ARRAY(ctypes.c_char_p, len(encoded))()
+    c_strings[:] = encoded
 
     return c_strings
 
 
 def _normalize_selection(
     selection: Union[Labels, LabelsEntry, Dict[str, int]]
-) -> Labels:
+) -> Union[Labels, LabelsEntry]:
     if isinstance(selection, dict):
+        names = _normalize_names_type(list(selection.keys()))
+
+        # fast path: convert all values at once when they are all integers in the
+        # range of int32
+        values = np.asarray(list(selection.values()))
+        if (
+            values.dtype.kind in "biu"
+            and len(values.shape) == 1
+            and values.shape[0] != 0
+            and values.min() >= _INT32_MIN
+            and values.max() <= _INT32_MAX
+        ):
+            return LabelsEntry(names, values.astype(np.int32))
+
+        # slow path, checking each value separately to give a better error message
         for key, value in selection.items():
             if not np.can_cast(value, np.int32, casting="same_kind"):
                 raise TypeError(
@@ -588,16 +723,13 @@ def _normalize_selection(
                     f"type {type(value)}"
                 )
 
-        return Labels(
-            list(selection.keys()),
-            np.array([[np.int32(v) for v in selection.values()]], dtype=np.int32),
+        return LabelsEntry(
+            names,
+            np.array([np.int32(v) for v in selection.values()], dtype=np.int32),
         )
 
-    elif isinstance(selection, Labels):
+    elif isinstance(selection, (Labels, LabelsEntry)):
         return selection
 
-    elif isinstance(selection, LabelsEntry):
-        return Labels(selection.names, selection.values.reshape(1, -1))
-
     else:
         raise TypeError(f"invalid type for block selection: {type(selection)}")
@@ -39,15 +39,33 @@ def catch_exceptions(function):
     return inner
 
 
+class _RawBuffer:
+    """
+    Minimal object exposing memory owned by the C library to numpy, through the
+    ``__array_interface__`` protocol. This is cheaper than going through
+    ``np.ctypeslib.as_array``, which creates a new ctypes array type for each shape.
+    """
+
+    __slots__ = ("__array_interface__",)
+
+    def __init__(self, ptr, shape, dtype):
+        self.__array_interface__ = {
+            "version": 3,
+            "shape": tuple(shape),
+            "typestr": np.dtype(dtype).str,
+            "data": (ctypes.cast(ptr, ctypes.c_void_p).value, False),
+        }
+
+
 def _ptr_to_ndarray(ptr, shape, dtype):
     if functools.reduce(operator.mul, shape) == 0:
         return np.empty(shape=shape, dtype=dtype)
 
     assert ptr is not None
-    array = np.ctypeslib.as_array(ptr, shape=shape)
+    array = np.asarray(_RawBuffer(ptr, shape, dtype))
     assert array.dtype == dtype
     assert not array.flags["OWNDATA"]
-    array.flags["WRITEABLE"] = True
+    assert array.flags["WRITEABLE"]
     return array
 
 
@@ -2,6 +2,7 @@ import numpy as np
 import pytest
 
 from equistore.core import EquistoreError, Labels
+from equistore.core.labels import _same_buffer
 
 
 def test_constructor():
@@ -74,6 +75,44 @@ def test_position():
     assert (2, 3) in labels
     assert (2, -1) not in labels
 
+    # other entry types
+    assert labels.position(labels[2]) == 2
+    assert labels.position(np.array([2, 2], dtype=np.int64)) == 2
+    assert labels.position([np.int32(1), np.int64(0)]) == 1
+
+    message = "Labels entry must be convertible to integers"
+    with pytest.raises(TypeError, match=message):
+        labels.position((0.5, 1))
+
+
+def test_positions():
+    labels = Labels(
+        names=["a", "b"],
+        values=np.array([[0, 0], [1, 0], [2, 2], [2, 3]]),
+    )
+
+    entries = np.array([[2, 3], [2, -1], [0, 0], [2, 3]])
+    positions = labels.positions(entries)
+    assert positions.dtype == np.int64
+    np.testing.assert_equal(positions, np.array([3, -1, 0, 3]))
+
+    positions = labels.positions(np.zeros((0, 2), dtype=np.int32))
+    assert positions.shape == (0,)
+
+    positions = labels.positions(np.array([[4, 4]]))
+    np.testing.assert_equal(positions, np.array([-1]))
+
+    message = (
+        "`entries` must be a 2D array with one column for each dimension of "
+        "these Labels"
+    )
+    with pytest.raises(ValueError, match=message):
+        labels.positions(np.array([[0, 0, 0]]))
+
+    message = "can not call `positions` on a Labels view, call `to_owned` before"
+    with pytest.raises(ValueError, match=message):
+        labels.view("a").positions(np.array([[0]]))
+
 
 def test_not_writeable():
     labels = Labels(
@@ -99,6 +138,7 @@ def test_custom_constructors():
     label = Labels.single()
     assert label.names == ["_"]
     assert label.values.shape == (1, 1)
+    assert Labels.single() is label
 
     # Labels.range
     labels = Labels.range("name", 10)
@@ -157,6 +197,10 @@ def test_view():
     assert owned.position([1]) == 0
     assert owned.position([-1]) is None
 
+    owned = labels.view(["bbb", "aaa"]).to_owned()
+    assert owned.names == ["bbb", "aaa"]
+    np.testing.assert_equal(owned.values, np.array([[2, 1], [4, 3]]))
+
     view = labels.view(["aaa", "aaa"])
     message = "invalid parameter: labels names must be unique, got 'aaa' multiple times"
     with pytest.raises(EquistoreError, match=message):
@@ -248,6 +292,12 @@ def test_indexing():
     column = labels["b"]
     np.testing.assert_equal(column, np.array([2, 4]))
 
+    # repeated access to the columns
+    column = labels["a"]
+    np.testing.assert_equal(column, np.array([1, 3]))
+    assert column.flags.c_contiguous
+    assert not column.flags.writeable
+
     # indexing labels errors
     message = "index 3 is out of bounds for axis 0 with size 2"
     with pytest.raises(IndexError, match=message):
@@ -352,6 +402,30 @@ def test_eq():
     assert labels_1[1] == labels_3[1]
 
 
+def test_eq_shared_buffer():
+    labels = Labels(names=("a", "b"), values=np.array([[0, 0], [0, 1]]))
+    other = Labels(names=("a", "b"), values=np.array([[0, 0], [0, 1]]))
+
+    # the values of the same Labels share their buffer
+    assert _same_buffer(labels.values, labels.values)
+    assert labels == labels
+
+    # separate Labels with the same values do not
+    assert not _same_buffer(labels.values, other.values)
+    assert labels == other
+
+    # views with different shapes/strides on the same memory are not the same
+    assert not _same_buffer(labels.values, labels.values[:1])
+    assert not _same_buffer(labels.values, labels.values[::-1])
+
+    # entries at the same position of the same Labels
+    assert labels[0] == labels[0]
+    assert labels[1] != labels[0]
+    # entries of different Labels
+    assert labels[1] == other[1]
+    assert labels[1] != other[0]
+
+
 def test_union():
     first = Labels(["aa", "bb"], np.array([[0, 1], [1, 2]]))
     second = Labels(["aa", "bb"], np.array([[2, 3], [1, 2], [4, 5]]))
@@ -1,5 +1,6 @@
 import io
 import os
+import pathlib
 import pickle
 import sys
 
@@ -111,6 +112,19 @@ def test_save_warning_errors(tmpdir, tensor):
     expected = f"adding '.npz' extension, the file will be saved at '{tmpfile}.npz'"
     assert str(record[0].message) == expected
 
+    # same with a pathlib.Path
+    tmpfile = pathlib.Path("serialize-test-path")
+
+    with pytest.warns() as record:
+        with tmpdir.as_cwd():
+            equistore.core.save(tmpfile, tensor)
+            assert os.path.exists("serialize-test-path.npz")
+
+    expected = (
+        "adding '.npz' extension, the file will be saved at 'serialize-test-path.npz'"
+    )
+    assert str(record[0].message) == expected
+
     tmpfile = "serialize-test.npz"
 
     message = (
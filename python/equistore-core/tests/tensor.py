@@ -94,6 +94,14 @@ def test_labels_names(tensor):
     assert tensor.components_names == [["c"]]
     assert tensor.property_names == ["p"]
 
+    # modifying the returned names does not change the tensor
+    tensor.sample_names.append("foo")
+    tensor.components_names[0].append("foo")
+    tensor.property_names.append("foo")
+    assert tensor.sample_names == ["s"]
+    assert tensor.components_names == [["c"]]
+    assert tensor.property_names == ["p"]
+
 
 def test_block(tensor):
     # block by index
@@ -116,6 +124,14 @@ def test_block(tensor):
     block = tensor[tensor.keys[0]]
     assert_equal(block.values, np.full((3, 1, 1), 1.0))
 
+    # block by Label entry from iterating over the keys
+    for i, key in enumerate(tensor.keys):
+        assert_equal(tensor.block(key).values, tensor.block(i).values)
+
+    # block by Label entry with negative index
+    block = tensor.block(tensor.keys[-1])
+    assert_equal(block.values, tensor.block(3).values)
+
     # 0 blocks matching criteria
     msg = "couldn't find any block matching \\(key_1=3\\)"
     with pytest.raises(ValueError, match=msg):
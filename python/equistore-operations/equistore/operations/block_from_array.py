@@ -1,7 +1,14 @@
+import functools
+
 import equistore.core
 from equistore.core import Labels, TensorBlock
 
 
+# Labels with more entries than this are not cached by `_range_labels`, to limit
+# the memory used by the cache
+_MAX_CACHED_RANGE = 1024
+
+
 def block_from_array(array: equistore.core.data.Array) -> TensorBlock:
     """
     Creates a simple TensorBlock from an array.
@@ -50,13 +57,29 @@ def block_from_array(array: equistore.core.data.Array) -> TensorBlock:
         )
 
     components = [
-        Labels.range(f"component_{component_index+1}", axis_size)
+        _range_labels(f"component_{component_index+1}", axis_size)
         for component_index, axis_size in enumerate(shape[1:-1])
     ]
 
     return TensorBlock(
         values=array,
-        samples=Labels.range("sample", shape[0]),
+        samples=_range_labels("sample", shape[0]),
         components=components,
-        properties=Labels.range("property", shape[-1]),
+        properties=_range_labels("property", shape[-1]),
     )
+
+
+def _range_labels(name: str, size: int) -> Labels:
+    """
+    Get ``Labels.range(name, size)``, re-using the same instance for small sizes.
+    This is fine since Labels are immutable.
+    """
+    if size <= _MAX_CACHED_RANGE:
+        return _cached_range_labels(name, size)
+    else:
+        return Labels.range(name, size)
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_range_labels(name: str, size: int) -> Labels:
+    return Labels.range(name, size)
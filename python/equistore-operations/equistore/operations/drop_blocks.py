@@ -19,7 +19,8 @@ def drop_blocks(tensor: TensorMap, keys: Labels, copy: bool = False) -> TensorMa
         (default), the values of the blocks in the output :py:class:`TensorMap`
         reference the same data as the input `tensor`. The latter can be useful
         for limiting memory usage, but should be used with caution when
-        manipulating the underlying data.
+        manipulating the underlying data. If no block is dropped and ``copy`` is
+        :py:obj:`False`, the input ``tensor`` is returned directly.
 
     :return:
         the input :py:class:`TensorMap` with the specified key/block pairs
@@ -40,55 +41,56 @@ def drop_blocks(tensor: TensorMap, keys: Labels, copy: bool = False) -> TensorMa
     # Find the indices of keys to remove
     tensor_keys = tensor.keys
     _, to_remove, used_in_intersection = tensor_keys.intersection_and_mapping(keys)
-    to_remove_indices = np.where(to_remove != -1)[0]
+    to_keep_indices = np.flatnonzero(to_remove == -1)
 
     not_present_in_tensor = np.where(used_in_intersection == -1)[0]
     if len(not_present_in_tensor) != 0:
         key = keys[not_present_in_tensor[0]]
         raise ValueError(f"{key.print()} is not present in this tensor")
 
+    if not copy and len(to_keep_indices) == len(tensor_keys):
+        # nothing to drop, and the blocks would share all their data anyway
+        return tensor
+
     # Create the new TensorMap
-    new_blocks = []
-    new_keys_values = []
-    for i in range(len(tensor_keys)):
-        if i in to_remove_indices:
-            continue
-
-        new_keys_values.append(tensor_keys[i].values)
-        block = tensor[i]
-
-        if copy:
-            new_blocks.append(block.copy())
-        else:
-            # just increase the reference count on everything
-            new_block = TensorBlock(
-                values=block.values,
-                samples=block.samples,
-                components=block.components,
-                properties=block.properties,
-            )
-
-            for parameter, gradient in block.gradients():
-                if len(gradient.gradients_list()) != 0:
-                    raise NotImplementedError(
-                        "gradients of gradients are not supported"
-                    )
-
-                new_block.add_gradient(
-                    parameter=parameter,
-                    gradient=TensorBlock(
-                        values=gradient.values,
-                        samples=gradient.samples,
-                        components=gradient.components,
-                        properties=new_block.properties,
-                    ),
-                )
-
-            new_blocks.append(new_block)
-
-    if len(new_keys_values) != 0:
-        new_keys = Labels(keys.names, np.vstack(new_keys_values))
+    new_keys = Labels(keys.names, tensor_keys.values[to_keep_indices])
+
+    blocks = tensor.blocks_by_id(to_keep_indices.tolist())
+    if copy:
+        new_blocks = [block.copy() for block in blocks]
     else:
-        new_keys = Labels.empty(keys.names)
+        new_blocks = [_share_block_data(block) for block in blocks]
 
     return TensorMap(keys=new_keys, blocks=new_blocks)
+
+
+def _share_block_data(block: TensorBlock) -> TensorBlock:
+    """
+    Create a new block referencing the same values and metadata as ``block`` and
+    its gradients.
+    """
+    # just increase the reference count on everything. The properties are shared
+    # between the block and all its gradients, so we only get them once.
+    properties = block.properties
+    new_block = TensorBlock(
+        values=block.values,
+        samples=block.samples,
+        components=block.components,
+        properties=properties,
+    )
+
+    for parameter, gradient in block.gradients():
+        if len(gradient.gradients_list()) != 0:
+            raise NotImplementedError("gradients of gradients are not supported")
+
+        new_block.add_gradient(
+            parameter=parameter,
+            gradient=TensorBlock(
+                values=gradient.values,
+                samples=gradient.samples,
+                components=gradient.components,
+                properties=properties,
+            ),
+        )
+
+    return new_block
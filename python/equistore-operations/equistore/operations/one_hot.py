@@ -3,7 +3,13 @@ import numpy as np
 from equistore.core import Labels
 
 
-def one_hot(labels: Labels, dimension: Labels) -> np.ndarray:
+def one_hot(
+    labels: Labels,
+    dimension: Labels,
+    *,
+    return_indices: bool = False,
+    dtype=np.float64,
+) -> np.ndarray:
     """Generates one-hot encoding from a Labels object.
 
     This function takes two ``Labels`` objects as inputs. The first
@@ -19,13 +25,26 @@ def one_hot(labels: Labels, dimension: Labels) -> np.ndarray:
         this label is the same that will be selected from ``labels``,
         and its values correspond to all possible values that the label
         can take.
+    :param return_indices:
+        If ``True``, return the position in ``dimension`` of each label
+        instead of the dense one-hot encoding. This is a compact
+        representation of the same data: multiplying a matrix ``W`` by the
+        transposed one-hot encoding (``W @ one_hot.T``) is the same as
+        ``W[:, indices]``, without creating the dense array.
+    :param dtype:
+        numpy dtype of the one-hot encoding. Since it only contains zeros and
+        ones, a smaller type like ``np.float32`` or ``np.uint8`` can be used to
+        reduce memory usage. This is ignored if ``return_indices`` is ``True``.
 
     :return:
         A two-dimensional ``numpy.ndarray`` containing the one-hot
         encoding along the selected dimension: its first dimension
         matches the one in ``labels``, while the second contains 1
         at the position corresponding to the original label and 0
-        everywhere else
+        everywhere else, with the requested ``dtype``. If
+        ``return_indices`` is ``True``, this is instead a one-dimensional
+        ``numpy.ndarray`` of 64-bit integers containing the position of
+        each label in ``dimension``.
 
     >>> import numpy as np
     >>> import equistore
@@ -49,6 +68,9 @@ def one_hot(labels: Labels, dimension: Labels) -> np.ndarray:
      [1. 0. 0.]
      [0. 1. 0.]
      [1. 0. 0.]]
+    >>> # Get the positions of the 1 in each row of the one-hot encoding:
+    >>> print(equistore.one_hot(original_labels, possible_labels, return_indices=True))
+    [1 0 0 0 1 0]
     """
 
     if len(dimension.names) != 1:
@@ -59,16 +81,32 @@ def one_hot(labels: Labels, dimension: Labels) -> np.ndarray:
         )
 
     name = dimension.names[0]
+    values = labels[name]
 
-    indices = np.zeros(len(labels), dtype=np.int64)
-    for i, entry in enumerate(labels[name]):
-        position = dimension.position([entry])
-        if position is None:
-            raise ValueError(
-                f"{name}={entry} is present in the labels, but was not found in "
-                "the dimension"
-            )
-        indices[i] = position
+    # find the position of all values in the dimension at once, using a sorted copy
+    # of the dimension values
+    possible_values = dimension.values[:, 0]
+    order = np.argsort(possible_values)
+    sorted_values = possible_values[order]
 
-    one_hot_array = np.eye(len(dimension))[indices]
+    positions = np.searchsorted(sorted_values, values)
+    if len(sorted_values) != 0:
+        positions = np.minimum(positions, len(sorted_values) - 1)
+        found = sorted_values[positions] == values
+    else:
+        found = np.zeros(len(values), dtype=bool)
+
+    if not np.all(found):
+        entry = values[np.argmin(found)]
+        raise ValueError(
+            f"{name}={entry} is present in the labels, but was not found in "
+            "the dimension"
+        )
+
+    indices = order[positions]
+    if return_indices:
+        return indices
+
+    one_hot_array = np.zeros((len(values), len(dimension)), dtype=dtype)
+    one_hot_array[np.arange(len(values)), indices] = 1.0
     return one_hot_array
@@ -1,10 +1,9 @@
 from typing import Union
 
-from equistore.core import TensorMap
+from equistore.core import TensorBlock, TensorMap
 
-from ._utils import _check_same_keys
-from .add import add
-from .multiply import multiply
+from ._utils import _check_blocks, _check_same_gradients, _check_same_keys
+from .add import _add_block_constant
 
 
 def subtract(A: TensorMap, B: Union[float, TensorMap]) -> TensorMap:
@@ -32,14 +31,63 @@ def subtract(A: TensorMap, B: Union[float, TensorMap]) -> TensorMap:
 
     :return: New :py:class:`TensorMap` with the same metadata as ``A``.
     """
+    blocks = []
     if isinstance(B, TensorMap):
         _check_same_keys(A, B, "subtract")
-        B = multiply(B, -1)
+        for key, block_A in A.items():
+            block_B = B[key]
+            _check_blocks(
+                block_A,
+                block_B,
+                props=["samples", "components", "properties"],
+                fname="subtract",
+            )
+            _check_same_gradients(
+                block_A,
+                block_B,
+                props=["samples", "components", "properties"],
+                fname="subtract",
+            )
+            blocks.append(_subtract_block_block(block_1=block_A, block_2=block_B))
+
     elif isinstance(B, (float, int)):
         B = -float(B)
+        for block_A in A.blocks():
+            blocks.append(_add_block_constant(block=block_A, constant=B))
+
     else:
         raise TypeError("B should be a TensorMap or a scalar value")
 
-    tensor_result = add(A=A, B=B)
+    return TensorMap(A.keys, blocks)
+
+
+def _subtract_block_block(block_1: TensorBlock, block_2: TensorBlock) -> TensorBlock:
+    values = block_1.values - block_2.values
+
+    result_block = TensorBlock(
+        values=values,
+        samples=block_1.samples,
+        components=block_1.components,
+        properties=block_1.properties,
+    )
+
+    for parameter, gradient_1 in block_1.gradients():
+        gradient_2 = block_2.gradient(parameter)
+
+        if len(gradient_1.gradients_list()) != 0:
+            raise NotImplementedError("gradients of gradients are not supported")
+
+        if len(gradient_2.gradients_list()) != 0:
+            raise NotImplementedError("gradients of gradients are not supported")
+
+        result_block.add_gradient(
+            parameter=parameter,
+            gradient=TensorBlock(
+                values=gradient_1.values - gradient_2.values,
+                samples=gradient_1.samples,
+                components=gradient_1.components,
+                properties=gradient_1.properties,
+            ),
+        )
 
-    return tensor_result
+    return result_block
@@ -1,13 +1,23 @@
 """
 Module for finding unique metadata for TensorMaps and TensorBlocks
 """
-from typing import List, Optional, Tuple, Union
+import weakref
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 
 from equistore.core import Labels, TensorBlock, TensorMap
 
 
+# Cache of unique metadata, indexed by `id(tensor)` and then by
+# `(axis, names, gradient)`. The metadata of a TensorMap can not change after
+# creation, so the entries stay valid until the TensorMap is garbage collected,
+# at which point they are removed from the cache.
+_UNIQUE_CACHE: Dict[int, Dict[tuple, Labels]] = {}
+
+_INT32_MIN = np.iinfo(np.int32).min
+
+
 def unique_metadata(
     tensor: TensorMap,
     axis: str,
@@ -93,6 +103,9 @@ def unique_metadata(
         (default), the unique indices of the regular :py:class:`TensorBlock`
         objects will be calculated.
 
+    The result is cached, and repeated calls with the same ``tensor``, ``axis``,
+    ``names`` and ``gradient`` return the same :py:class:`Labels`.
+
     :return: a sorted :py:class:`Labels` object containing the unique metadata
         for the blocks of the input ``tensor`` or its gradient blocks for the
         specified parameter. Each element in the returned :py:class:`Labels`
@@ -106,14 +119,27 @@ def unique_metadata(
         if isinstance(names, str)
         else (list(names) if isinstance(names, tuple) else names)
     )
-    _check_args(tensor, axis, names, gradient)
+
+    cache = _UNIQUE_CACHE.get(id(tensor))
+    try:
+        cache_key = (axis, tuple(names), gradient)
+        return cache[cache_key]
+    except (KeyError, TypeError):
+        # TypeError is raised if cache is None, or for invalid arguments, which
+        # are checked below
+        pass
+
     # Make a list of the blocks to find unique indices for
-    if gradient is None:
-        blocks = tensor.blocks()
-    else:
-        blocks = [block.gradient(gradient) for block in tensor]
+    blocks = _check_args(tensor, axis, names, gradient)
+    unique = _unique_from_blocks(blocks, axis, names)
 
-    return _unique_from_blocks(blocks, axis, names)
+    if cache is None:
+        cache = {}
+        _UNIQUE_CACHE[id(tensor)] = cache
+        weakref.finalize(tensor, _UNIQUE_CACHE.pop, id(tensor), None)
+    cache[cache_key] = unique
+
+    return unique
 
 
 def unique_metadata_block(
@@ -187,13 +213,8 @@ def unique_metadata_block(
         if isinstance(names, str)
         else (list(names) if isinstance(names, tuple) else names)
     )
-    _check_args(block, axis, names, gradient)
-
     # Make a list of the blocks to find unique indices for
-    if gradient is None:
-        blocks = [block]
-    else:
-        blocks = [block.gradient(gradient)]
+    blocks = _check_args(block, axis, names, gradient)
 
     return _unique_from_blocks(blocks, axis, names)
 
@@ -215,7 +236,37 @@ def _unique_from_blocks(
             assert axis == "properties"
             all_values.append(block.properties.view(names).values)
 
-    unique_values = np.unique(np.vstack(all_values), axis=0)
+    # copy all the values in a single pre-allocated buffer
+    total = sum(values.shape[0] for values in all_values)
+    buffer = np.empty((total, len(names)), dtype=np.int32)
+    start = 0
+    for values in all_values:
+        stop = start + values.shape[0]
+        buffer[start:stop] = values
+        start = stop
+
+    if len(names) == 0:
+        # there is a single (empty) unique row if there is any row at all
+        unique_values = np.unique(buffer, axis=0)
+    elif len(names) == 1:
+        unique_values = np.unique(buffer[:, 0]).reshape(-1, 1)
+    elif len(names) == 2:
+        # pack both columns in a single int64, with the first column in the
+        # high bits. The second column is shifted to be positive, so the packed
+        # values sort in the same order as the rows.
+        packed = buffer[:, 0].astype(np.int64) << 32
+        packed += buffer[:, 1].astype(np.int64) - _INT32_MIN
+        packed = np.unique(packed)
+
+        unique_values = np.empty((len(packed), 2), dtype=np.int32)
+        unique_values[:, 0] = packed >> 32
+        unique_values[:, 1] = (packed & 0xFFFFFFFF) + _INT32_MIN
+    else:
+        # find unique rows by looking at the buffer as a 1-dimensional array of
+        # records, sorted field by field in the same order as `np.unique(axis=0)`
+        records = buffer.view([("", np.int32)] * len(names)).reshape(-1)
+        unique_values = np.unique(records).view(np.int32).reshape(-1, len(names))
+
     return Labels(names=names, values=unique_values)
 
 
@@ -224,8 +275,11 @@ def _check_args(
     axis: str,
     names: List[str],
     gradient: Optional[str] = None,
-):
-    """Checks input args for `unique_metadata` and `unique_metadata_block`"""
+) -> List[TensorBlock]:
+    """
+    Checks input args for `unique_metadata` and `unique_metadata_block`, and
+    returns the list of (gradient) blocks to find unique metadata for.
+    """
     # Check tensors
     if isinstance(tensor, TensorMap):
         blocks = tensor.blocks()
@@ -234,9 +288,14 @@ def _check_args(
                 raise TypeError(
                     f"`gradient` argument must be a `str`, not {type(gradient)}"
                 )
-            if not np.all([block.has_gradient(gradient) for block in blocks]):
+            missing = (
+                i for i, block in enumerate(blocks) if not block.has_gradient(gradient)
+            )
+            missing = next(missing, None)
+            if missing is not None:
                 raise ValueError(
-                    f"not all input blocks have a gradient with respect to '{gradient}'"
+                    f"the block for {tensor.keys[missing].print()} does not have "
+                    f"a gradient with respect to '{gradient}'"
                 )
             blocks = [block.gradient(gradient) for block in blocks]  # redefine blocks
 
@@ -264,8 +323,10 @@ def _check_args(
     if not isinstance(names, list):
         raise TypeError(f"`names` argument must be a list of str, not {type(names)}")
 
-    if not np.all([isinstance(name, str) for name in names]):
+    if not all(isinstance(name, str) for name in names):
         raise TypeError(
             "`names` argument must be a list of str, "
             + f"not {[type(name) for name in names]}"
         )
+
+    return blocks
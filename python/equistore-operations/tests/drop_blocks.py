@@ -62,6 +62,11 @@ def test_drop_nothing(test_tensor_map):
     empty_key = Labels.empty(test_tensor_map.keys.names)
     new_tensor = equistore.drop_blocks(test_tensor_map, empty_key)
     assert new_tensor == test_tensor_map
+    assert new_tensor is test_tensor_map
+
+    new_tensor = equistore.drop_blocks(test_tensor_map, empty_key, copy=True)
+    assert new_tensor == test_tensor_map
+    assert new_tensor is not test_tensor_map
 
 
 def test_not_existent(test_tensor_map):
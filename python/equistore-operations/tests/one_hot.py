@@ -49,6 +49,38 @@ def test_additional_value():
     np.testing.assert_allclose(one_hot_encoding, correct_encoding)
 
 
+def test_return_indices():
+    """Test getting the positions instead of the dense one-hot encoding."""
+    original_labels = Labels(
+        names=["atom", "species"],
+        values=np.array([[0, 6], [1, 1], [2, 1], [3, 1], [4, 6], [5, 8]]),
+    )
+    possible_labels = Labels(names=["species"], values=np.array([[8], [1], [6]]))
+
+    indices = equistore.one_hot(original_labels, possible_labels, return_indices=True)
+    np.testing.assert_equal(indices, np.array([2, 1, 1, 1, 2, 0]))
+
+    one_hot_encoding = equistore.one_hot(original_labels, possible_labels)
+    np.testing.assert_equal(np.argmax(one_hot_encoding, axis=1), indices)
+
+
+def test_dtype():
+    """Test one-hot encoding with a custom dtype."""
+    original_labels = Labels(
+        names=["atom", "species"],
+        values=np.array([[0, 6], [1, 1], [2, 1]]),
+    )
+    possible_labels = Labels(names=["species"], values=np.array([[1], [6]]))
+    correct_encoding = np.array([[0, 1], [1, 0], [1, 0]])
+
+    for dtype in [np.float32, np.uint8]:
+        one_hot_encoding = equistore.one_hot(
+            original_labels, possible_labels, dtype=dtype
+        )
+        assert one_hot_encoding.dtype == dtype
+        np.testing.assert_equal(one_hot_encoding, correct_encoding)
+
+
 def test_multiple_names():
     """Test one-hot encoding if multiple dimension names are provided."""
     original_labels = Labels(
@@ -1,3 +1,4 @@
+import functools
 import os
 
 import numpy as np
@@ -13,8 +14,9 @@ TEST_FILE = "qm7-spherical-expansion.npz"
 # ===== Fixtures and helper functions =====
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def tensor() -> TensorMap:
+    # the tests in this file only read from this tensor, so it is loaded once
     return equistore.load(
         os.path.join(DATA_ROOT, TEST_FILE),
         # the npz is using DEFLATE compression, equistore only supports STORED
@@ -22,6 +24,12 @@ def tensor() -> TensorMap:
     )
 
 
+@functools.lru_cache(maxsize=None)
+def _empty_labels(names) -> Labels:
+    # Labels are immutable, so the same empty Labels can be used for all blocks
+    return Labels.empty(names)
+
+
 def _construct_empty_slice_block(block, axis, labels) -> TensorBlock:
     if axis == "samples":
         reference_block = TensorBlock(
@@ -35,7 +43,7 @@ def _construct_empty_slice_block(block, axis, labels) -> TensorBlock:
                 parameter=parameter,
                 gradient=TensorBlock(
                     values=gradient.values[:0, ...],
-                    samples=Labels.empty(gradient.samples.names),
+                    samples=_empty_labels(tuple(gradient.samples.names)),
                     components=gradient.components,
                     properties=block.properties,
                 ),
@@ -62,93 +70,114 @@ def _construct_empty_slice_block(block, axis, labels) -> TensorBlock:
 
 
 def _check_sliced_block_samples(block, sliced_block, structures_to_keep):
+    structures_to_keep = np.asarray(structures_to_keep).ravel()
+    samples_filter = np.isin(block.samples["structure"], structures_to_keep)
+
     # no slicing of properties has occurred
-    assert np.all(block.properties == sliced_block.properties)
+    assert block.properties == sliced_block.properties
 
     # samples have been sliced to the correct dimension
-    assert len(sliced_block.samples) == len(
-        [s for s in block.samples["structure"] if s in structures_to_keep]
-    )
+    sliced_samples = sliced_block.samples
+    assert len(sliced_samples) == np.count_nonzero(samples_filter)
 
     # samples in sliced block only feature desired structure indices
-    assert np.all([s in structures_to_keep for s in sliced_block.samples["structure"]])
+    assert np.all(np.isin(sliced_samples["structure"], structures_to_keep))
 
     # no components have been sliced
     assert len(sliced_block.components) == len(block.components)
     for sliced_c, c in zip(sliced_block.components, block.components):
-        assert np.all(sliced_c == c)
+        assert sliced_c == c
 
     # we have the right values
-    samples_filter = np.array(
-        [sample["structure"] in structures_to_keep for sample in block.samples]
-    )
-    assert np.all(sliced_block.values == block.values[samples_filter, ...])
+    sliced_values = sliced_block.values
+    assert np.array_equal(sliced_values, block.values[samples_filter, ...])
 
+    sliced_gradients = dict(sliced_block.gradients())
     for parameter, gradient in block.gradients():
-        sliced_gradient = sliced_block.gradient(parameter)
+        sliced_gradient = sliced_gradients[parameter]
         # no slicing of properties has occurred
-        assert np.all(sliced_gradient.properties == gradient.properties)
+        assert sliced_gradient.properties == gradient.properties
+
+        gradient_samples = gradient.samples
+        sliced_gradient_samples = sliced_gradient.samples
 
         # samples have been updated to refer to the new samples
-        assert np.max(sliced_gradient.samples["sample"]) < sliced_block.values.shape[0]
+        max_sample = sliced_gradient_samples["sample"].max(initial=-1)
+        assert max_sample < sliced_values.shape[0]
 
         # other columns in the gradient samples have been sliced correctly
-        gradient_sample_filter = samples_filter[gradient.samples["sample"]]
-        if len(gradient.samples.names) > 1:
-            expected = gradient.samples.values[gradient_sample_filter, 1:]
-            sliced_gradient_samples = sliced_gradient.samples.values[:, 1:]
-            assert np.all(sliced_gradient_samples == expected)
+        gradient_sample_filter = samples_filter[gradient_samples["sample"]]
+        if len(gradient_samples.names) > 1:
+            expected = gradient_samples.values[gradient_sample_filter, 1:]
+            assert np.array_equal(sliced_gradient_samples.values[:, 1:], expected)
 
         # same components as the original
         assert len(gradient.components) == len(sliced_gradient.components)
         for sliced_c, c in zip(sliced_gradient.components, gradient.components):
-            assert np.all(sliced_c == c)
+            assert sliced_c == c
 
         expected = gradient.values[gradient_sample_filter]
-        assert np.all(sliced_gradient.values == expected)
+        assert np.array_equal(sliced_gradient.values, expected)
 
 
 def _check_sliced_block_properties(block, sliced_block, radial_to_keep):
+    radial_to_keep = np.asarray(radial_to_keep).ravel()
+    property_idx = np.flatnonzero(np.isin(block.properties["n"], radial_to_keep))
+
     # no slicing of samples has occurred
-    assert np.all(block.samples == sliced_block.samples)
+    assert block.samples == sliced_block.samples
 
     # properties have been sliced to the correct dimension
-    assert len(sliced_block.properties) == len(
-        [n for n in block.properties["n"] if n in radial_to_keep]
-    )
+    sliced_properties = sliced_block.properties
+    assert len(sliced_properties) == len(property_idx)
 
     # properties in sliced block only feature desired radial indices
-    assert np.all([n in radial_to_keep for n in sliced_block.properties["n"]])
+    assert np.all(np.isin(sliced_properties["n"], radial_to_keep))
 
     # no components have been sliced
     assert len(sliced_block.components) == len(block.components)
     for sliced_c, c in zip(sliced_block.components, block.components):
-        assert np.all(sliced_c == c)
+        assert sliced_c == c
 
     # we have the right values
-    property_filter = [property["n"] in radial_to_keep for property in block.properties]
-    assert np.all(sliced_block.values == block.values[..., property_filter])
+    assert np.array_equal(sliced_block.values, block.values[..., property_idx])
 
+    sliced_gradients = dict(sliced_block.gradients())
     for parameter, gradient in block.gradients():
-        sliced_gradient = sliced_block.gradient(parameter)
+        sliced_gradient = sliced_gradients[parameter]
         # no slicing of samples has occurred
-        assert np.all(sliced_gradient.samples == gradient.samples)
+        assert sliced_gradient.samples == gradient.samples
 
         # properties have been sliced to the correct dimension
-        assert len(sliced_gradient.properties) == len(
-            [n for n in gradient.properties["n"] if n in radial_to_keep]
+        sliced_gradient_properties = sliced_gradient.properties
+        assert len(sliced_gradient_properties) == np.count_nonzero(
+            np.isin(gradient.properties["n"], radial_to_keep)
         )
 
         # properties in sliced block only feature desired radial indices
-        assert np.all([n in radial_to_keep for n in sliced_gradient.properties["n"]])
+        assert np.all(np.isin(sliced_gradient_properties["n"], radial_to_keep))
 
         # same components as the original
         assert len(gradient.components) == len(sliced_gradient.components)
         for sliced_c, c in zip(sliced_gradient.components, gradient.components):
-            assert np.all(sliced_c == c)
+            assert sliced_c == c
 
         # we have the right values
-        assert np.all(sliced_gradient.values == gradient.values[..., property_filter])
+        expected = gradient.values[..., property_idx]
+        assert np.array_equal(sliced_gradient.values, expected)
+
+
+def _check_sliced_block_samples_and_properties(
+    sliced_block, centers_to_keep, channels_to_keep, expected
+):
+    # only desired samples are in the output.
+    assert np.all(np.isin(sliced_block.samples["center"], centers_to_keep))
+
+    # only desired properties are in the output
+    assert np.all(np.isin(sliced_block.properties["n"], channels_to_keep))
+
+    # There are the correct number of samples and properties, and the right values
+    assert np.array_equal(sliced_block.values, expected)
 
 
 def _check_empty_block(block, sliced_block, axis):
@@ -159,19 +188,20 @@ def _check_empty_block(block, sliced_block, axis):
     else:
         sliced_axis, unsliced_axis = -1, 0
     # sliced block has no values
-    assert len(sliced_block.values.flatten()) == 0
+    assert sliced_block.values.size == 0
     # sliced block has dimension zero for properties
     assert sliced_block.values.shape[sliced_axis] == 0
     # sliced block has original dimension for samples
     assert sliced_block.values.shape[unsliced_axis] == block.values.shape[unsliced_axis]
 
+    sliced_gradients = dict(sliced_block.gradients())
     for parameter, gradient in block.gradients():
-        sliced_gradient = sliced_block.gradient(parameter)
+        sliced_gradient = sliced_gradients[parameter]
         # no slicing of samples has occurred
         if axis == "s":
-            assert np.all(sliced_gradient.properties == gradient.properties)
+            assert sliced_gradient.properties == gradient.properties
         else:
-            assert np.all(sliced_gradient.samples == gradient.samples)
+            assert sliced_gradient.samples == gradient.samples
 
         # sliced block contains zero properties
         assert sliced_gradient.values.shape[sliced_axis] == 0
@@ -341,6 +371,10 @@ def test_slice_block_samples_and_properties(tensor):
         values=channels_to_keep,
     )
 
+    samples_filter = np.isin(block.samples["center"], centers_to_keep.ravel())
+    properties_filter = np.isin(block.properties["n"], channels_to_keep.ravel())
+    expected = block.values[samples_filter][..., properties_filter]
+
     # First, slice on samples and then on properties
     sliced_block = equistore.slice_block(
         block,
@@ -352,31 +386,10 @@ def test_slice_block_samples_and_properties(tensor):
         axis="properties",
         labels=properties,
     )
-
-    # only desired samples are in the output.
-    assert np.all([c in centers_to_keep for c in sliced_block.samples["center"]])
-
-    # only desired properties are in the output
-    assert np.all([n in channels_to_keep for n in sliced_block.properties["n"]])
-
-    # There are the correct number of samples
-    assert sliced_block.values.shape[0] == len(
-        [s for s in block.samples if s["center"] in centers_to_keep]
-    )
-
-    # There are the correct number of properties
-    assert sliced_block.values.shape[-1] == len(
-        [p for p in block.properties if p["n"] in channels_to_keep]
+    _check_sliced_block_samples_and_properties(
+        sliced_block, centers_to_keep, channels_to_keep, expected
     )
 
-    # we have the right values
-    samples_filter = [sample["center"] in centers_to_keep for sample in block.samples]
-    properties_filter = [
-        property["n"] in channels_to_keep for property in block.properties
-    ]
-    expected = block.values[samples_filter][..., properties_filter]
-    assert np.all(sliced_block.values == expected)
-
     # Second, slice on properties and then on samples
     sliced_block = equistore.slice_block(
         block,
@@ -388,75 +401,58 @@ def test_slice_block_samples_and_properties(tensor):
         axis="samples",
         labels=samples,
     )
-
-    # only desired samples are in the output.
-    assert np.all([c in centers_to_keep for c in sliced_block.samples["center"]])
-
-    # only desired properties are in the output
-    assert np.all([n in channels_to_keep for n in sliced_block.properties["n"]])
-
-    # There are the correct number of samples
-    assert sliced_block.values.shape[0] == len(
-        [s for s in block.samples if s["center"] in centers_to_keep]
+    _check_sliced_block_samples_and_properties(
+        sliced_block, centers_to_keep, channels_to_keep, expected
     )
 
-    # There are the correct number of properties
-    assert sliced_block.values.shape[-1] == len(
-        [p for p in block.properties if p["n"] in channels_to_keep]
-    )
-
-    # we have the right values
-    samples_filter = [sample["center"] in centers_to_keep for sample in block.samples]
-    properties_filter = [
-        property["n"] in channels_to_keep for property in block.properties
-    ]
-    expected = block.values[samples_filter][..., properties_filter]
-    assert np.all(sliced_block.values == expected)
-
 
 def test_slicing_by_empty(tensor):
     empty_labels_samples = Labels.empty(tensor.sample_names)
+    empty_labels_properties = Labels.empty(tensor.property_names)
+
+    # build the reference empty blocks for both axes in a single pass
+    samples_block_list = []
+    properties_block_list = []
+    for block in tensor:
+        samples_block_list.append(
+            _construct_empty_slice_block(block, "samples", empty_labels_samples)
+        )
+        properties_block_list.append(
+            _construct_empty_slice_block(block, "properties", empty_labels_properties)
+        )
+
+    first_block = tensor.block(0)
+    keys = tensor.keys
 
     # Empty block returned if no samples to slice by are passed
     reference_block = _construct_empty_slice_block(
-        tensor.block(0), "samples", empty_labels_samples
+        first_block, "samples", empty_labels_samples
     )
     assert equistore.equal_block(
-        equistore.slice_block(
-            tensor.block(0), axis="samples", labels=empty_labels_samples
-        ),
+        equistore.slice_block(first_block, axis="samples", labels=empty_labels_samples),
         reference_block,
     )
 
     # Empty tensor returned if no samples to slice by are passed
-    block_list = [
-        _construct_empty_slice_block(block, "samples", empty_labels_samples)
-        for block in tensor
-    ]
-    reference_tensor = TensorMap(tensor.keys, block_list)
+    reference_tensor = TensorMap(keys, samples_block_list)
     assert equistore.equal(
         equistore.slice(tensor, axis="samples", labels=empty_labels_samples),
         reference_tensor,
     )
 
-    empty_labels_properties = Labels.empty(tensor.property_names)
     # Empty block returned if no properties to slice by are passed
     reference_block = _construct_empty_slice_block(
-        tensor.block(0), "properties", empty_labels_properties
+        first_block, "properties", empty_labels_properties
     )
     assert equistore.equal_block(
         equistore.slice_block(
-            tensor.block(0), axis="properties", labels=empty_labels_properties
+            first_block, axis="properties", labels=empty_labels_properties
         ),
         reference_block,
     )
 
     # Empty tensor returned if no properties to slice by are passed
-    block_list = [
-        _construct_empty_slice_block(block, "properties", empty_labels_properties)
-        for block in tensor
-    ]
-    reference_tensor = TensorMap(tensor.keys, block_list)
+    reference_tensor = TensorMap(keys, properties_block_list)
     assert equistore.equal(
         equistore.slice(tensor, axis="properties", labels=empty_labels_properties),
         reference_tensor,
@@ -464,53 +460,36 @@ def test_slicing_by_empty(tensor):
 
 
 def test_slicing_all(tensor):
+    all_samples = equistore.unique_metadata(
+        tensor, axis="samples", names=tensor.sample_names
+    )
+    all_properties = equistore.unique_metadata(
+        tensor, axis="properties", names=tensor.property_names
+    )
+
     # Original block returned if sliced on all samples
     assert equistore.equal_block(
-        equistore.slice_block(
-            tensor.block(0),
-            axis="samples",
-            labels=equistore.unique_metadata(
-                tensor, axis="samples", names=tensor.sample_names
-            ),
-        ),
+        equistore.slice_block(tensor.block(0), axis="samples", labels=all_samples),
         tensor.block(0),
     )
 
     # Original tensor returned if sliced on all samples
     assert equistore.equal(
-        equistore.slice(
-            tensor,
-            axis="samples",
-            labels=equistore.unique_metadata(
-                tensor, axis="samples", names=tensor.sample_names
-            ),
-        ),
+        equistore.slice(tensor, axis="samples", labels=all_samples),
         tensor,
     )
 
     # Original block returned if sliced on all properties
     assert equistore.equal_block(
         equistore.slice_block(
-            tensor.block(0),
-            axis="properties",
-            labels=equistore.unique_metadata(
-                tensor,
-                axis="properties",
-                names=tensor.property_names,
-            ),
+            tensor.block(0), axis="properties", labels=all_properties
         ),
         tensor.block(0),
     )
 
     # Original tensor returned if sliced on all properties
     assert equistore.equal(
-        equistore.slice(
-            tensor,
-            axis="properties",
-            labels=equistore.unique_metadata(
-                tensor, axis="properties", names=tensor.property_names
-            ),
-        ),
+        equistore.slice(tensor, axis="properties", labels=all_properties),
         tensor,
     )
 
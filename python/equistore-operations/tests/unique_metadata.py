@@ -158,6 +158,33 @@ def test_unique_metadata(tensor, large_tensor):
     assert target_properties == actual_properties
 
 
+def test_unique_metadata_no_names(tensor):
+    # without any names, all samples are the same empty entry
+    unique = equistore.unique_metadata(tensor, "samples", [])
+    assert unique.names == []
+    assert unique.values.shape == (1, 0)
+
+    unique = equistore.unique_metadata_block(tensor.block(0), "properties", [])
+    assert unique.names == []
+    assert unique.values.shape == (1, 0)
+
+
+def test_unique_metadata_cache(tensor):
+    first = equistore.unique_metadata(tensor, "samples", "s")
+    # names given as str, tuple or list share the same cache entry
+    assert equistore.unique_metadata(tensor, "samples", ("s",)) is first
+    assert equistore.unique_metadata(tensor, "samples", ["s"]) is first
+
+    gradient = equistore.unique_metadata(tensor, "samples", "sample", gradient="g")
+    assert gradient is not first
+    assert equistore.unique_metadata(tensor, "samples", "sample", "g") is gradient
+
+    # the cache is not shared between different tensors
+    other = equistore.unique_metadata(tensor.copy(), "samples", "s")
+    assert other == first
+    assert other is not first
+
+
 def test_unique_metadata_block_errors(real_tensor):
     message = "`block` argument must be an equistore TensorBlock"
     with pytest.raises(TypeError, match=message):
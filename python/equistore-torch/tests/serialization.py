@@ -7,37 +7,32 @@ import equistore.torch
 from . import utils
 
 
+DATA_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "..", "..", "equistore", "tests", "data.npz"
+)
+
+KEYS_NAMES = ["spherical_harmonics_l", "center_species", "neighbor_species"]
+SAMPLES_NAMES = ["structure", "center"]
+GRADIENT_SAMPLES_NAMES = ["sample", "structure", "atom"]
+
+
 def check_tensor(tensor):
-    assert tensor.keys.names == [
-        "spherical_harmonics_l",
-        "center_species",
-        "neighbor_species",
-    ]
+    assert tensor.keys.names == KEYS_NAMES
     assert len(tensor.keys) == 27
 
     block = tensor.block(
         dict(spherical_harmonics_l=2, center_species=6, neighbor_species=1)
     )
-    assert block.samples.names == ["structure", "center"]
+    assert block.samples.names == SAMPLES_NAMES
     assert block.values.shape == (9, 5, 3)
 
     gradient = block.gradient("positions")
-    assert gradient.samples.names == ["sample", "structure", "atom"]
+    assert gradient.samples.names == GRADIENT_SAMPLES_NAMES
     assert gradient.values.shape == (59, 3, 5, 3)
 
 
 def test_load():
-    loaded = equistore.torch.load(
-        os.path.join(
-            os.path.dirname(__file__),
-            "..",
-            "..",
-            "..",
-            "equistore",
-            "tests",
-            "data.npz",
-        ),
-    )
+    loaded = equistore.torch.load(DATA_PATH)
 
     check_tensor(loaded)
 
@@ -56,17 +51,7 @@ def test_save(tmpdir):
 
 
 def test_pickle(tmpdir):
-    tensor = equistore.torch.load(
-        os.path.join(
-            os.path.dirname(__file__),
-            "..",
-            "..",
-            "..",
-            "equistore",
-            "tests",
-            "data.npz",
-        ),
-    )
+    tensor = equistore.torch.load(DATA_PATH)
     tmpfile = "serialize-test.npz"
 
     with tmpdir.as_cwd():